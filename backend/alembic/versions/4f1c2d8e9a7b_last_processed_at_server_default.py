@@ -0,0 +1,34 @@
+"""last_processed_at server default
+
+Revision ID: 4f1c2d8e9a7b
+Revises: b9e227681a52
+Create Date: 2025-10-27 10:12:31.418206
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f1c2d8e9a7b'
+down_revision: Union[str, Sequence[str], None] = 'b9e227681a52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column('videos', 'last_processed_at',
+               existing_type=sa.DateTime(timezone=True),
+               server_default=sa.text('now()'),
+               existing_nullable=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column('videos', 'last_processed_at',
+               existing_type=sa.DateTime(timezone=True),
+               server_default=None,
+               existing_nullable=True)
@@ -0,0 +1,41 @@
+"""History pagination index on processing_results (created_at, id)
+
+Revision ID: 7d3e5a1b2c90
+Revises: 4f1c2d8e9a7b
+Create Date: 2025-10-27 11:40:05.902114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d3e5a1b2c90'
+down_revision: Union[str, Sequence[str], None] = '4f1c2d8e9a7b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_pr_created_id',
+            'processing_results',
+            [sa.text('created_at DESC'), sa.text('id DESC')],
+            unique=False,
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'idx_pr_created_id',
+            table_name='processing_results',
+            postgresql_concurrently=True
+        )
@@ -0,0 +1,48 @@
+"""processing_results.ai_tools as JSONB with GIN index
+
+Revision ID: a2b6c4e8f013
+Revises: 7d3e5a1b2c90
+Create Date: 2025-10-27 14:03:52.117930
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a2b6c4e8f013'
+down_revision: Union[str, Sequence[str], None] = '7d3e5a1b2c90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column('processing_results', 'ai_tools',
+               existing_type=sa.JSON(),
+               type_=postgresql.JSONB(astext_type=sa.Text()),
+               postgresql_using='ai_tools::jsonb',
+               existing_nullable=False,
+               existing_comment='JSON array of AI tools extracted by GPT-4o-mini')
+    op.create_index(
+        'idx_pr_tools_gin',
+        'processing_results',
+        ['ai_tools'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'ai_tools': 'jsonb_path_ops'}
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_pr_tools_gin', table_name='processing_results', postgresql_using='gin')
+    op.alter_column('processing_results', 'ai_tools',
+               existing_type=postgresql.JSONB(astext_type=sa.Text()),
+               type_=sa.JSON(),
+               postgresql_using='ai_tools::json',
+               existing_nullable=False,
+               existing_comment='JSON array of AI tools extracted by GPT-4o-mini')
@@ -0,0 +1,66 @@
+"""
+In-process LLM response cache
+Exact-match cache for agent outputs keyed by transcript hash + model + prompt version
+
+Black box interface:
+- hash_transcript(transcript, video_title) -> str
+- make_key(transcript_hash, model, prompt_version) -> str
+- lookup(key) -> cached value or None
+- store(key, value)
+
+Repeat processing of the same video (e.g. preset demo videos) yields a
+bit-identical transcript, so notes/tools can be reused without another
+Gemini/OpenAI round-trip.
+"""
+import hashlib
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+# Maximum number of cached responses kept per process (LRU eviction)
+MAX_ENTRIES = 256
+
+_entries: "OrderedDict[str, Any]" = OrderedDict()
+
+
+def hash_transcript(transcript: str, video_title: Optional[str] = None) -> str:
+    """
+    Hash transcript content (computed once per graph run, shared by all agents).
+
+    blake2b is used over sha256 for higher hashing throughput on long transcripts.
+    """
+    digest = hashlib.blake2b(transcript.encode(), digest_size=16)
+    if video_title:
+        digest.update(video_title.encode())
+    return digest.hexdigest()
+
+
+def make_key(transcript_hash: str, model: str, prompt_version: str) -> str:
+    """
+    Build cache key from a precomputed transcript hash, model id and prompt version.
+
+    The prompt version keeps edited prompts from serving output cached
+    under the previous prompt.
+    """
+    return f"{transcript_hash}:{model}:{prompt_version}"
+
+
+def lookup(key: str) -> Optional[Any]:
+    """Return cached value for key (marking it recently used), or None on miss"""
+    value = _entries.get(key)
+    if value is not None:
+        _entries.move_to_end(key)
+    return value
+
+
+def store(key: str, value: Any) -> None:
+    """Store value under key, evicting the least recently used entry when full"""
+    _entries[key] = value
+    _entries.move_to_end(key)
+    if len(_entries) > MAX_ENTRIES:
+        _entries.popitem(last=False)
+
+
+def clear() -> None:
+    """Drop all cached responses"""
+    _entries.clear()
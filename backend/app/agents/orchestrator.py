@@ -17,12 +17,131 @@ Architecture:
       ↓
   Return MultiAgentResult
 """
-from typing import TypedDict, List, Annotated
+from typing import (
+    TypedDict, List, Annotated, Optional, Callable, Awaitable, TypeVar,
+    AsyncGenerator, AsyncIterator, Tuple, Mapping, Any
+)
+import os
+import re
+import asyncio
+import logging
 import operator
+import functools
+import weakref
+from functools import partial
+from types import MappingProxyType
+from langgraph.config import get_stream_writer
 from langgraph.graph import StateGraph, START, END
+from langgraph.types import Send
 
+from app.agents import cache
 from app.models import AITool, VideoMetadata
 from app.tools import YouTubeTranscriptExtractor, LectureSummarizer, AIToolExtractor
+from app.tools.text_utils import normalize_transcript
+from app.tools.tool_extractor import ToolExtractionTruncatedError
+
+
+logger = logging.getLogger("notelens.orchestrator")
+
+T = TypeVar("T")
+
+
+# ============================================================================
+# LLM Call Deadlines
+# ============================================================================
+
+# First-attempt deadline per agent. Agent 2 streams, so its deadline covers
+# time-to-first-chunk only; Agent 3 waits for the whole completion (prefill of
+# the transcript plus up to MAX_OUTPUT_TOKENS of JSON) and gets more headroom.
+SUMMARIZER_TIMEOUT_S = float(os.getenv("SUMMARIZER_TIMEOUT_S", "12.0"))
+TOOL_EXTRACTOR_TIMEOUT_S = float(os.getenv("TOOL_EXTRACTOR_TIMEOUT_S", "30.0"))
+
+# Map-step section calls are not streamed: the deadline covers the whole
+# completion (prefill of a ~8k-token section plus its condensed notes)
+SECTION_TIMEOUT_S = float(os.getenv("SECTION_TIMEOUT_S", "30.0"))
+
+# The single retry gets a longer deadline (12s -> 20s, 30s -> 50s with the defaults)
+RETRY_TIMEOUT_FACTOR = 5 / 3
+
+# Max gap between two Agent 2 stream chunks once streaming has started
+SUMMARIZER_IDLE_TIMEOUT_S = float(os.getenv("SUMMARIZER_IDLE_TIMEOUT_S", "30.0"))
+
+# Upper bound on in-flight LLM calls per process (guards provider QPS limits
+# when many graphs run concurrently, e.g. via aprocess_batch)
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "8"))
+
+# One semaphore per event loop: asyncio primitives bind to the loop that first
+# uses them, and process() / test clients / reloads each run a new loop
+_llm_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _llm_semaphore() -> asyncio.Semaphore:
+    """Return the LLM concurrency semaphore for the running event loop"""
+    loop = asyncio.get_running_loop()
+    semaphore = _llm_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _llm_semaphores[loop] = asyncio.Semaphore(LLM_MAX_CONCURRENCY)
+    return semaphore
+
+
+async def call_with_deadline(
+    make_call: Callable[[], Awaitable[T]],
+    timeout: float,
+    agent_name: str
+) -> T:
+    """
+    Await an LLM call with a deadline and one bounded retry.
+
+    Caps long-tail provider stalls: the first attempt is cancelled after
+    `timeout` seconds and retried once with a longer deadline. A second
+    timeout propagates as asyncio.TimeoutError.
+    """
+    async with _llm_semaphore():
+        try:
+            return await asyncio.wait_for(make_call(), timeout=timeout)
+        except asyncio.TimeoutError:
+            retry_timeout = timeout * RETRY_TIMEOUT_FACTOR
+            logger.warning(
+                "%s: timed out after %.1fs, retrying (deadline %.1fs)",
+                agent_name, timeout, retry_timeout
+            )
+            return await asyncio.wait_for(make_call(), timeout=retry_timeout)
+
+
+# ============================================================================
+# Tool-Mention Prescan
+# ============================================================================
+
+# Transcripts shorter than this are not worth a GPT-4o-mini round-trip
+MIN_TOOL_EXTRACTION_CHARS = 500
+
+# Cheap prescan for AI tool mentions; Agent 3 is skipped when nothing matches.
+# Only specific tool/product names count (generic words like "model" or "API"
+# appear in nearly every technical lecture and would disable the skip).
+# Names are matched as whole words, with an optional version suffix so
+# "GPT4o", "Llama-3.1" and "PyTorch's" still match but "Chromatic" does not.
+TOOL_MENTION_PATTERN = re.compile(
+    r"\b(?:"
+    r"DeepSeek|Qwen|Grok|Perplexity|Cohere|Groq|Qdrant|Milvus|Sora|"
+    r"GPT|ChatGPT|OpenAI|Claude|Anthropic|Gemini|Bard|Llama|Mistral|Mixtral|"
+    r"BERT|T5|Whisper|DALL-?E|Midjourney|Stable Diffusion|Copilot|Cursor|"
+    r"LangChain|LangGraph|LlamaIndex|CrewAI|AutoGen|DSPy|Ollama|vLLM|"
+    r"Hugging ?Face|Transformers|PyTorch|TensorFlow|Keras|JAX|NumPy|Pandas|"
+    r"scikit-learn|sklearn|XGBoost|Pinecone|Weaviate|Chroma|FAISS|"
+    r"SageMaker|Vertex AI|Bedrock|Azure OpenAI|Jupyter|Colab|Kaggle|CUDA"
+    r")(?:-?\d[\w.]*)?\b",
+    re.IGNORECASE
+)
+
+
+def mentions_ai_tools(transcript: str) -> bool:
+    """Return True if the transcript is long enough and names at least one known tool"""
+    return (
+        len(transcript) >= MIN_TOOL_EXTRACTION_CHARS
+        and TOOL_MENTION_PATTERN.search(transcript) is not None
+    )
 
 
 # ============================================================================
@@ -40,127 +159,369 @@ class OverallState(TypedDict):
     """
     # Input (read-only)
     video_url: str
+    force_refresh: bool  # Regenerate instead of reusing cached agent outputs
 
     # From Agent 1 (Transcript Fetcher)
-    transcript: str
-    video_metadata: dict
+    transcript: str  # Raw text, stored and shown to users
+    prompt_transcript: str  # Normalized text, fed to Agents 2 and 3
+    video_metadata: Optional[VideoMetadata]
+    video_title: str
+    transcript_hash: str  # Computed once, shared by Agents 2 and 3
 
     # From Agent 2 (Summarizer) - Gemini
     lecture_notes: str
 
     # From Agent 3 (Tool Extractor) - GPT-4o-mini
-    ai_tools: List[dict]
+    ai_tools: List[AITool]
 
     # Execution tracking - uses reducer for parallel updates
-    # Annotated with operator.add tells LangGraph to concatenate lists
-    # when multiple nodes update this key concurrently
-    agent_execution_order: Annotated[List[str], operator.add]
+    # Annotated with operator.add tells LangGraph to concatenate
+    # when multiple nodes update this key concurrently.
+    # Immutable tuples avoid any aliasing between parallel branches.
+    agent_execution_order: Annotated[tuple[str, ...], operator.add]
+
+
+# Node-specific input types (narrow payloads dispatched via Send)
+class SummarizerInput(TypedDict):
+    """Input schema for summarizer node"""
+    prompt_transcript: str
+    video_title: str
+    transcript_hash: str
+    force_refresh: bool
+
+
+class ToolExtractorInput(TypedDict):
+    """Input schema for tool extractor node"""
+    prompt_transcript: str
+    video_title: str
+    transcript_hash: str
+    force_refresh: bool
 
 
 # Node-specific output types (what each node produces)
 class TranscriptOutput(TypedDict):
     """Output schema for transcript fetcher node"""
     transcript: str
-    video_metadata: dict
-    agent_execution_order: list[str]
+    prompt_transcript: str
+    video_metadata: VideoMetadata
+    video_title: str
+    transcript_hash: str
+    agent_execution_order: tuple[str, ...]
 
 
 class SummarizerOutput(TypedDict):
     """Output schema for summarizer node"""
     lecture_notes: str
-    agent_execution_order: list[str]
+    agent_execution_order: tuple[str, ...]
 
 
 class ToolExtractorOutput(TypedDict):
     """Output schema for tool extractor node"""
-    ai_tools: List[dict]
-    agent_execution_order: list[str]
+    ai_tools: List[AITool]
+    agent_execution_order: tuple[str, ...]
 
 
 # ============================================================================
 # Agent Node Functions
 # ============================================================================
 
-def fetch_transcript_node(state: OverallState) -> TranscriptOutput:
+async def fetch_transcript_node(
+    state: OverallState,
+    extractor: YouTubeTranscriptExtractor
+) -> TranscriptOutput:
     """
     Agent 1: Extract transcript from YouTube video.
     Uses YouTubeTranscriptExtractor tool.
 
     Returns TranscriptOutput (subset of OverallState).
     """
-    print("🎬 Agent 1: Fetching transcript...")
+    logger.info("Agent 1: Fetching transcript")
+
+    # Only the text is needed downstream; skip building timestamped chunks
+    video_metadata, transcript = await extractor.aextract_text_only(state["video_url"])
 
-    extractor = YouTubeTranscriptExtractor()
-    transcript_data = extractor.extract(state["video_url"])
+    # Normalize once; both LLM agents receive the smaller text
+    # (the raw transcript is kept for storage and display)
+    prompt_transcript = normalize_transcript(transcript)
 
-    print(f"✅ Agent 1: Transcript fetched ({len(transcript_data.full_text)} chars)")
+    logger.info(
+        "Agent 1: Transcript fetched (%d chars, %d after normalization)",
+        len(transcript), len(prompt_transcript)
+    )
 
     # Return only what this node produces
     return {
-        "transcript": transcript_data.full_text,
-        "video_metadata": transcript_data.metadata.model_dump(),
-        "agent_execution_order": ["fetch_transcript"]
+        "transcript": transcript,
+        "prompt_transcript": prompt_transcript,
+        "video_metadata": video_metadata,
+        "video_title": video_metadata.video_title,
+        # Hash the (possibly multi-MB) transcript once instead of once per agent
+        "transcript_hash": cache.hash_transcript(prompt_transcript, video_metadata.video_title),
+        "agent_execution_order": ("fetch_transcript",)
     }
 
 
-def summarize_node(state: OverallState) -> SummarizerOutput:
+async def summarize_node(
+    state: SummarizerInput,
+    summarizer: LectureSummarizer
+) -> SummarizerOutput:
     """
     Agent 2: Generate lecture notes using Gemini 2.5 Flash.
     Runs in parallel with Agent 3.
 
+    Notes are generated with Gemini streaming; each chunk is emitted on the
+    graph's custom stream ({"type": "chunk", "data": text}) so streaming
+    callers can forward it immediately. Non-streaming callers ignore them.
+
     Returns SummarizerOutput (subset of OverallState).
     """
-    print("📝 Agent 2: Generating lecture notes with Gemini...")
+    logger.info("Agent 2: Generating lecture notes with Gemini")
 
-    summarizer = LectureSummarizer()
-    video_title = state["video_metadata"].get("video_title")
+    write = get_stream_writer()
 
-    lecture_notes = summarizer.summarize(
-        transcript=state["transcript"],
-        video_title=video_title
+    # Exact-match cache: skip the Gemini call for a previously seen transcript
+    # (force_refresh regenerates, but the fresh notes are still stored)
+    cache_key = cache.make_key(
+        state["transcript_hash"], summarizer.model, summarizer.prompt_version
     )
-
-    print(f"✅ Agent 2: Lecture notes generated ({len(lecture_notes)} chars)")
+    lecture_notes = None if state["force_refresh"] else cache.lookup(cache_key)
+
+    if lecture_notes is None:
+        transcript = state["prompt_transcript"]
+        video_title = state["video_title"]
+
+        if summarizer.needs_map_reduce(transcript):
+            # Long lecture: summarize sections in parallel, stream only the reduce pass
+            section_notes, complete = await _summarize_sections(
+                summarizer, transcript, video_title
+            )
+            logger.info("Agent 2: Map step done (%d sections)", len(section_notes))
+            open_stream = lambda: summarizer.reduce_stream(section_notes, video_title)
+        else:
+            complete = True
+            open_stream = lambda: summarizer.summarize_stream(transcript, video_title)
+
+        # Deadline covers time-to-first-chunk only, so a retry never
+        # re-emits chunks that were already streamed
+        first_chunk, stream = await call_with_deadline(
+            lambda: _open_notes_stream(open_stream),
+            timeout=SUMMARIZER_TIMEOUT_S,
+            agent_name="Agent 2"
+        )
+
+        parts = []
+        if first_chunk is not None:
+            parts.append(first_chunk)
+            write({"type": "chunk", "data": first_chunk})
+        # Chunks already went out, so a mid-stream stall is not retried
+        async for chunk in _iter_with_idle_timeout(stream, SUMMARIZER_IDLE_TIMEOUT_S):
+            parts.append(chunk)
+            write({"type": "chunk", "data": chunk})
+
+        lecture_notes = "".join(parts)
+        # Notes built from a partial map step are served but not cached
+        if complete:
+            cache.store(cache_key, lecture_notes)
+        logger.info("Agent 2: Lecture notes generated (%d chars)", len(lecture_notes))
+    else:
+        write({"type": "chunk", "data": lecture_notes})
+        logger.info("Agent 2: Lecture notes served from cache (%d chars)", len(lecture_notes))
 
     # Return only what this node produces
     return {
         "lecture_notes": lecture_notes,
-        "agent_execution_order": ["summarize"]
+        "agent_execution_order": ("summarize",)
     }
 
 
-def extract_tools_node(state: OverallState) -> ToolExtractorOutput:
+async def extract_tools_node(
+    state: ToolExtractorInput,
+    extractor: AIToolExtractor
+) -> ToolExtractorOutput:
     """
     Agent 3: Extract AI tools using GPT-4o-mini.
     Runs in parallel with Agent 2.
 
+    If both attempts time out, or the output is truncated at the token cap,
+    the run continues with no AI tools rather than failing the whole graph
+    (nothing is cached).
+
     Returns ToolExtractorOutput (subset of OverallState).
     """
-    print("🔧 Agent 3: Extracting AI tools with GPT-4o-mini...")
+    logger.info("Agent 3: Extracting AI tools with GPT-4o-mini")
 
-    extractor = AIToolExtractor()
-    video_title = state["video_metadata"].get("video_title")
-
-    ai_tools = extractor.extract(
-        transcript=state["transcript"],
-        video_title=video_title
+    # Exact-match cache: skip the GPT-4o-mini call for a previously seen transcript
+    # (force_refresh regenerates, but the fresh tools are still stored)
+    cache_key = cache.make_key(
+        state["transcript_hash"], extractor.model, extractor.prompt_version
     )
-
-    print(f"✅ Agent 3: Extracted {len(ai_tools)} AI tools")
+    ai_tools = None if state["force_refresh"] else cache.lookup(cache_key)
+
+    if ai_tools is None:
+        try:
+            ai_tools = await call_with_deadline(
+                lambda: extractor.aextract(
+                    transcript=state["prompt_transcript"],
+                    video_title=state["video_title"]
+                ),
+                timeout=TOOL_EXTRACTOR_TIMEOUT_S,
+                agent_name="Agent 3"
+            )
+        except asyncio.TimeoutError:
+            logger.error("Agent 3: Timed out on retry, continuing without AI tools")
+            return {
+                "ai_tools": [],
+                "agent_execution_order": ("extract_tools_timed_out",)
+            }
+        except ToolExtractionTruncatedError:
+            logger.error("Agent 3: Output truncated, continuing without AI tools")
+            return {
+                "ai_tools": [],
+                "agent_execution_order": ("extract_tools_truncated",)
+            }
+        cache.store(cache_key, ai_tools)
+        logger.info("Agent 3: Extracted %d AI tools", len(ai_tools))
+    else:
+        logger.info("Agent 3: %d AI tools served from cache", len(ai_tools))
 
     # Return only what this node produces
-    # Convert to dicts for JSON serialization
+    # Pydantic models are kept as-is; FastAPI serializes them once at response time
+    return {
+        "ai_tools": ai_tools,
+        "agent_execution_order": ("extract_tools",)
+    }
+
+
+async def _summarize_sections(
+    summarizer: LectureSummarizer,
+    transcript: str,
+    video_title: str
+) -> Tuple[List[str], bool]:
+    """
+    Map step for long transcripts: one Gemini call per section, run concurrently.
+
+    Each call gets SECTION_TIMEOUT_S and holds an LLM concurrency slot,
+    so the fan-out counts against LLM_MAX_CONCURRENCY. A failed section
+    is dropped from the reduce input instead of aborting the run.
+
+    Returns:
+        (section notes in transcript order, True if every section succeeded)
+
+    Raises:
+        RuntimeError: If every section failed
+    """
+    sections = summarizer.split_sections(transcript)
+    results = await asyncio.gather(*(
+        call_with_deadline(
+            partial(summarizer.asummarize_section, section, index, len(sections), video_title),
+            timeout=SECTION_TIMEOUT_S,
+            agent_name=f"Agent 2 (section {index + 1}/{len(sections)})"
+        )
+        for index, section in enumerate(sections)
+    ), return_exceptions=True)
+
+    section_notes = []
+    for index, result in enumerate(results):
+        if isinstance(result, BaseException):
+            logger.error(
+                "Agent 2: Section %d/%d failed, skipping it: %r",
+                index + 1, len(sections), result
+            )
+        else:
+            section_notes.append(result)
+
+    if not section_notes:
+        raise RuntimeError(f"All {len(sections)} transcript sections failed to summarize")
+
+    return section_notes, len(section_notes) == len(sections)
+
+
+async def _iter_with_idle_timeout(
+    stream: AsyncGenerator[str, None],
+    idle_timeout: float
+) -> AsyncIterator[str]:
+    """Yield stream chunks; raise asyncio.TimeoutError if one takes longer than idle_timeout"""
+    try:
+        while True:
+            try:
+                chunk = await asyncio.wait_for(anext(stream), timeout=idle_timeout)
+            except StopAsyncIteration:
+                return
+            yield chunk
+    except asyncio.TimeoutError:
+        logger.error("Agent 2: Stream stalled for %.1fs, aborting", idle_timeout)
+        raise
+    finally:
+        await stream.aclose()
+
+
+async def _open_notes_stream(
+    open_stream: Callable[[], AsyncGenerator[str, None]]
+) -> Tuple[Optional[str], AsyncGenerator[str, None]]:
+    """Start Gemini streaming and wait for the first chunk"""
+    stream = open_stream()
+    first_chunk = await anext(stream, None)
+    return first_chunk, stream
+
+
+async def skip_extract_tools_node(state: ToolExtractorInput) -> ToolExtractorOutput:
+    """
+    Agent 3 short-circuit: no tool mentions found by the prescan.
+
+    Returns an empty ToolExtractorOutput without calling GPT-4o-mini.
+    """
+    logger.info("Agent 3: Skipped (no AI tool mentions found in transcript)")
+
     return {
-        "ai_tools": [tool.model_dump() for tool in ai_tools],
-        "agent_execution_order": ["extract_tools"]
+        "ai_tools": [],
+        "agent_execution_order": ("extract_tools_skipped",)
+    }
+
+
+def dispatch_agents(state: OverallState) -> List[Send]:
+    """
+    Router: Fan out to Agents 2 and 3 in a single superstep.
+
+    Each branch receives only the normalized transcript, title, precomputed
+    transcript hash and force_refresh flag it needs instead of a copy of
+    the full OverallState. Agent 3 is replaced by a no-op when the
+    transcript is short or mentions no known AI tools.
+    """
+    payload = {
+        "prompt_transcript": state["prompt_transcript"],
+        "video_title": state["video_title"],
+        "transcript_hash": state["transcript_hash"],
+        "force_refresh": state["force_refresh"]
     }
+    tools_node = "extract_tools" if mentions_ai_tools(state["prompt_transcript"]) else "skip_extract_tools"
+
+    return [
+        Send("summarize", payload),
+        Send(tools_node, payload)
+    ]
 
 
 # ============================================================================
 # StateGraph Builder
 # ============================================================================
 
-def create_multi_agent_graph():
+@functools.cache
+def get_shared_tools() -> Tuple[YouTubeTranscriptExtractor, LectureSummarizer, AIToolExtractor]:
+    """
+    Process-wide tool instances (registry of long-lived LLM clients).
+
+    Every orchestrator in the process shares them, which also lets
+    create_multi_agent_graph() return the same compiled graph.
+    """
+    return YouTubeTranscriptExtractor(), LectureSummarizer(), AIToolExtractor()
+
+
+@functools.cache
+def create_multi_agent_graph(
+    transcript_extractor: YouTubeTranscriptExtractor,
+    summarizer: LectureSummarizer,
+    tool_extractor: AIToolExtractor
+):
     """
     Create and compile the LangGraph StateGraph.
 
@@ -170,37 +531,77 @@ def create_multi_agent_graph():
     Agents 2 and 3 execute in parallel after Agent 1 completes.
 
     Uses OverallState as the state schema with node-specific output types.
+    Tool instances are bound into the nodes so their HTTP clients
+    (and connection pools) are reused across invocations.
+
+    Memoized per tool instances: the graph is built and compiled once per
+    tool set, no matter how many orchestrators are created.
     """
     # Create StateGraph with OverallState
     workflow = StateGraph(OverallState)
 
     # Add nodes (agents)
-    workflow.add_node("fetch_transcript", fetch_transcript_node)
-    workflow.add_node("summarize", summarize_node)
-    workflow.add_node("extract_tools", extract_tools_node)
+    workflow.add_node(
+        "fetch_transcript",
+        partial(fetch_transcript_node, extractor=transcript_extractor)
+    )
+    workflow.add_node(
+        "summarize",
+        partial(summarize_node, summarizer=summarizer),
+        input_schema=SummarizerInput
+    )
+    workflow.add_node(
+        "extract_tools",
+        partial(extract_tools_node, extractor=tool_extractor),
+        input_schema=ToolExtractorInput
+    )
+    workflow.add_node(
+        "skip_extract_tools",
+        skip_extract_tools_node,
+        input_schema=ToolExtractorInput
+    )
 
     # Add edges (flow control)
     # Start with transcript fetching
     workflow.add_edge(START, "fetch_transcript")
 
     # After fetching, BOTH summarize and extract_tools run in parallel
-    # This is the key to parallel execution in LangGraph
-    workflow.add_edge("fetch_transcript", "summarize")
-    workflow.add_edge("fetch_transcript", "extract_tools")
+    # Send dispatches each branch with only the keys it reads
+    # (extract_tools is swapped for skip_extract_tools when prescan finds nothing)
+    workflow.add_conditional_edges(
+        "fetch_transcript",
+        dispatch_agents,
+        ["summarize", "extract_tools", "skip_extract_tools"]
+    )
 
     # Both parallel nodes end the graph when they complete
     workflow.add_edge("summarize", END)
     workflow.add_edge("extract_tools", END)
+    workflow.add_edge("skip_extract_tools", END)
 
     # Compile the graph
     app = workflow.compile()
 
-    print("✅ LangGraph StateGraph compiled successfully")
-    print("📊 Graph structure: START → fetch_transcript → [summarize, extract_tools] → END")
+    logger.info("LangGraph StateGraph compiled: START → fetch_transcript → [summarize, extract_tools] → END")
 
     return app
 
 
+# Read-only defaults shared by every run; nodes replace keys, never mutate them
+_INITIAL_STATE_TEMPLATE: Mapping[str, Any] = MappingProxyType({
+    "video_url": "",
+    "force_refresh": False,
+    "transcript": "",
+    "prompt_transcript": "",
+    "video_metadata": None,
+    "video_title": "",
+    "transcript_hash": "",
+    "lecture_notes": "",
+    "ai_tools": (),
+    "agent_execution_order": ()
+})
+
+
 # ============================================================================
 # Orchestrator Class (Black Box Interface)
 # ============================================================================
@@ -214,39 +615,146 @@ class MultiAgentOrchestrator:
     - Output: Complete processed result with lecture notes + AI tools
 
     Internal implementation uses LangGraph for parallel agent execution.
+    Create once and reuse: tool clients are long-lived.
     """
 
     def __init__(self):
-        """Initialize the orchestrator with compiled StateGraph"""
-        self.graph = create_multi_agent_graph()
-
-    def process(self, video_url: str) -> dict:
+        """Initialize the orchestrator with shared long-lived tools and compiled StateGraph"""
+        (
+            self.transcript_extractor,
+            self.summarizer,
+            self.tool_extractor
+        ) = get_shared_tools()
+
+        self.graph = create_multi_agent_graph(
+            self.transcript_extractor,
+            self.summarizer,
+            self.tool_extractor
+        )
+
+    async def aprocess(self, video_url: str, force_refresh: bool = False) -> dict:
         """
         Main interface: Process video through multi-agent system.
 
         Args:
             video_url: YouTube video URL
+            force_refresh: Regenerate notes/tools instead of reusing cached outputs
 
         Returns:
             dict with all results (transcript, notes, tools, metadata)
         """
-        # Initialize state
-        initial_state = {
-            "video_url": video_url,
-            "transcript": "",
-            "video_metadata": {},
-            "lecture_notes": "",
-            "ai_tools": [],
-            "agent_execution_order": []
-        }
-
-        print(f"\n🚀 Starting multi-agent processing for: {video_url}\n")
+        initial_state = self._initial_state(video_url, force_refresh)
+
+        logger.info("Starting multi-agent processing for: %s", video_url)
 
         # Run the graph
-        # LangGraph automatically handles parallel execution
-        final_state = self.graph.invoke(initial_state)
+        # Async nodes let Agents 2 and 3 overlap on the event loop
+        final_state = await self.graph.ainvoke(initial_state)
 
-        print(f"\n✅ Multi-agent processing complete!")
-        print(f"📋 Agent execution order: {' → '.join(final_state['agent_execution_order'])}\n")
+        logger.info(
+            "Multi-agent processing complete (execution order: %s)",
+            " → ".join(final_state["agent_execution_order"])
+        )
 
         return final_state
+
+    def process(self, video_url: str, force_refresh: bool = False) -> dict:
+        """
+        Sync wrapper around aprocess() for callers without a running event loop
+        (scripts, notebooks). Async code should await aprocess() directly.
+
+        Args:
+            video_url: YouTube video URL
+            force_refresh: Regenerate notes/tools instead of reusing cached outputs
+
+        Returns:
+            dict with all results (transcript, notes, tools, metadata)
+        """
+        async def run() -> dict:
+            try:
+                return await self.aprocess(video_url, force_refresh)
+            finally:
+                # Pooled async connections belong to this asyncio.run loop
+                await self.tool_extractor.aclose()
+
+        return asyncio.run(run())
+
+    async def astream(
+        self,
+        video_url: str,
+        force_refresh: bool = False
+    ) -> AsyncIterator[Tuple[str, dict]]:
+        """
+        Streaming interface: Process video and yield progress as it happens.
+
+        Yields (mode, payload) tuples:
+        - ("updates", {node_name: node_output}) when an agent finishes
+        - ("custom", {"type": "chunk", "data": text}) for each lecture notes
+          chunk while Agent 2 is still generating (Agent 3 runs concurrently)
+
+        Args:
+            video_url: YouTube video URL
+            force_refresh: Regenerate notes/tools instead of reusing cached outputs
+        """
+        logger.info("Starting streamed multi-agent processing for: %s", video_url)
+
+        async for mode, payload in self.graph.astream(
+            self._initial_state(video_url, force_refresh),
+            stream_mode=["updates", "custom"]
+        ):
+            yield mode, payload
+
+    async def aprocess_batch(
+        self,
+        video_urls: List[str],
+        max_concurrency: int = 8
+    ) -> List[dict | Exception]:
+        """
+        Batch interface: Process several videos concurrently.
+
+        All graph runs share the event loop, so their LLM calls interleave
+        instead of running one video after another.
+
+        Args:
+            video_urls: YouTube video URLs
+            max_concurrency: Maximum number of graphs running at once
+
+        Returns:
+            List aligned with video_urls: final state dict on success,
+            or the raised exception for videos that failed
+        """
+        logger.info("Starting batch processing for %d videos", len(video_urls))
+
+        final_states = await self.graph.abatch(
+            [self._initial_state(url) for url in video_urls],
+            config={"max_concurrency": max_concurrency},
+            return_exceptions=True
+        )
+
+        failed = sum(isinstance(state, Exception) for state in final_states)
+        logger.info(
+            "Batch processing complete (%d succeeded, %d failed)",
+            len(video_urls) - failed, failed
+        )
+
+        return final_states
+
+    async def aclose(self) -> None:
+        """
+        Release the shared tools (call once on app shutdown).
+
+        Closes the pooled async LLM connections and drops the cached tool
+        registry and compiled graph, so a later orchestrator (next lifespan,
+        new event loop) starts with fresh clients.
+        """
+        await self.tool_extractor.aclose()
+        get_shared_tools.cache_clear()
+        create_multi_agent_graph.cache_clear()
+
+    # =========================================================================
+    # PRIVATE METHODS - Implementation details hidden from interface
+    # =========================================================================
+
+    def _initial_state(self, video_url: str, force_refresh: bool = False) -> OverallState:
+        """Build the initial graph state for a single video"""
+        return _INITIAL_STATE_TEMPLATE | {"video_url": video_url, "force_refresh": force_refresh}
@@ -9,12 +9,15 @@ Black box interface:
 
 Following FastAPI 0.115+ and SQLAlchemy 2.0 best practices (Oct 2025)
 """
-from typing import Annotated
+import base64
+import binascii
+import logging
+from typing import Annotated, Optional, Tuple
 from uuid import UUID
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import select, func, desc
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy import select, func, desc, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import (
@@ -28,8 +31,11 @@ from app.models import (
 )
 from app.database import get_db
 from app.database.models import Video, ProcessingResult
+from app.api.http_cache import conditional_response, encode_json
 
 
+logger = logging.getLogger("notelens.history")
+
 # ============================================================================
 # Router Configuration
 # ============================================================================
@@ -41,6 +47,33 @@ router = APIRouter(
 )
 
 
+# ============================================================================
+# Keyset Pagination Cursor
+# ============================================================================
+
+def _encode_cursor(created_at: datetime, result_id: UUID) -> str:
+    """Encode the (created_at, id) sort key of the last row as an opaque cursor"""
+    raw = f"{created_at.isoformat()}|{result_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """
+    Decode a cursor produced by _encode_cursor.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed
+    """
+    try:
+        created_at, result_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), UUID(result_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
+
+
 # ============================================================================
 # API Endpoints
 # ============================================================================
@@ -50,7 +83,8 @@ async def get_history_list(
     db: Annotated[AsyncSession, Depends(get_db)],
     page: int = Query(1, ge=1, description="Page number (1-indexed)"),
     page_size: int = Query(20, ge=1, le=100, description="Results per page"),
-    search: str = Query(None, description="Search by video title or channel name")
+    search: str = Query(None, description="Search by video title or channel name"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from a previous response (overrides page)")
 ) -> HistoryListResponse:
     """
     Get paginated list of all processed videos.
@@ -62,29 +96,44 @@ async def get_history_list(
     - page: Page number (default: 1)
     - page_size: Results per page (default: 20, max: 100)
     - search: Optional search term for title/channel filtering
+    - cursor: next_cursor from a previous response; seeks past that row
+      instead of using OFFSET (index seek, stable under concurrent inserts).
+      Cursor pages skip the count (total is None): counting would read
+      every row past the cursor and defeat the index seek.
 
     Returns:
     - List of history items with metadata
-    - Pagination information (total, page, page_size)
+    - Pagination information (total, page, page_size, next_cursor)
     """
+    # Decode before the try block so a bad cursor stays a 400
+    after = _decode_cursor(cursor) if cursor else None
+
     try:
-        # Calculate offset for pagination
-        offset = (page - 1) * page_size
+        # Calculate offset for pagination (keyset mode doesn't skip rows)
+        offset = 0 if after else (page - 1) * page_size
 
         # Build base query joining processing_results with videos
+        # (list columns only - transcript/notes stay out of the list view).
+        columns = [
+            ProcessingResult.id,
+            Video.video_id,
+            Video.title,
+            Video.channel_name,
+            Video.duration,
+            ProcessingResult.ai_tools_count,
+            ProcessingResult.processing_time_seconds,
+            ProcessingResult.created_at
+        ]
+        # Offset pages: COUNT(*) OVER () returns the filtered total with each
+        # page row, so total and page come back in a single round trip
+        if not after:
+            columns.append(func.count().over().label("total"))
+
         query = (
-            select(
-                ProcessingResult.id,
-                Video.video_id,
-                Video.title,
-                Video.channel_name,
-                Video.duration,
-                ProcessingResult.ai_tools_count,
-                ProcessingResult.processing_time_seconds,
-                ProcessingResult.created_at
-            )
+            select(*columns)
             .join(Video, ProcessingResult.video_id == Video.id)
-            .order_by(desc(ProcessingResult.created_at))
+            # Matches idx_pr_created_id (created_at DESC, id DESC)
+            .order_by(desc(ProcessingResult.created_at), desc(ProcessingResult.id))
         )
 
         # Apply search filter if provided
@@ -95,18 +144,34 @@ async def get_history_list(
                 (Video.channel_name.ilike(search_filter))
             )
 
-        # Get total count (before pagination)
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await db.execute(count_query)
-        total = total_result.scalar() or 0
-
-        # Apply pagination
-        query = query.offset(offset).limit(page_size)
+        # Keyset: seek past the cursor row via idx_pr_created_id
+        if after:
+            query = query.where(
+                tuple_(ProcessingResult.created_at, ProcessingResult.id) < tuple_(*after)
+            )
 
-        # Execute query
-        result = await db.execute(query)
+        # Apply pagination and execute (one extra row tells us if more exist)
+        result = await db.execute(query.offset(offset).limit(page_size + 1))
         rows = result.all()
 
+        next_cursor = None
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            next_cursor = _encode_cursor(rows[-1].created_at, rows[-1].id)
+
+        if after:
+            total = None
+        elif rows:
+            total = rows[0].total
+        elif page > 1:
+            # Page past the end carries no window count; count separately
+            count_query = select(func.count()).select_from(
+                query.with_only_columns(ProcessingResult.id).order_by(None).subquery()
+            )
+            total = (await db.execute(count_query)).scalar() or 0
+        else:
+            total = 0
+
         # Convert to Pydantic models
         history_items = [
             HistoryItemSummary(
@@ -128,13 +193,12 @@ async def get_history_list(
             total=total,
             page=page,
             page_size=page_size,
+            next_cursor=next_cursor,
             error=None
         )
 
     except Exception as e:
-        print(f"❌ History list error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("History list error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to fetch history: {str(e)}"
@@ -144,8 +208,9 @@ async def get_history_list(
 @router.get("/{result_id}", response_model=HistoryDetailResponse, status_code=status.HTTP_200_OK)
 async def get_history_detail(
     result_id: UUID,
+    request: Request,
     db: Annotated[AsyncSession, Depends(get_db)]
-) -> HistoryDetailResponse:
+) -> Response:
     """
     Get complete details for a specific processing result.
 
@@ -155,6 +220,8 @@ async def get_history_detail(
     - Video metadata
     - Processing information
 
+    Responses carry an ETag; a matching If-None-Match returns 304.
+
     Raises:
     - 404: If processing result not found
     """
@@ -178,7 +245,9 @@ async def get_history_detail(
         processing_result, video = row
 
         # Build response matching MultiAgentResult structure
-        video_metadata = VideoMetadata(
+        # Rows were validated before they were stored: construct without
+        # validation (the raw Response below also bypasses response_model)
+        video_metadata = VideoMetadata.model_construct(
             video_id=video.video_id,
             video_title=video.title,
             video_url=video.video_url,
@@ -187,9 +256,9 @@ async def get_history_detail(
         )
 
         # Convert AI tools from JSON to Pydantic models
-        ai_tools = [AITool(**tool) for tool in processing_result.ai_tools]
+        ai_tools = [AITool.model_construct(**tool) for tool in processing_result.ai_tools]
 
-        result_data = MultiAgentResult(
+        result_data = MultiAgentResult.model_construct(
             video_metadata=video_metadata,
             lecture_notes=processing_result.lecture_notes,
             ai_tools=ai_tools,
@@ -197,19 +266,24 @@ async def get_history_detail(
             agent_execution_order=processing_result.agent_execution_order
         )
 
-        return HistoryDetailResponse(
+        response = HistoryDetailResponse.model_construct(
             success=True,
             data=result_data,
             processed_at=processing_result.created_at.isoformat(),
             error=None
         )
 
+        # Results are immutable once stored; clients revalidate via ETag
+        return conditional_response(
+            request,
+            encode_json(response.model_dump(mode="json")),
+            cache_control="private, no-cache"
+        )
+
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ History detail error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("History detail error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to fetch history detail: {str(e)}"
@@ -258,9 +332,7 @@ async def delete_history_item(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ History delete error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("History delete error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to delete history item: {str(e)}"
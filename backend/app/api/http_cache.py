@@ -0,0 +1,54 @@
+"""
+HTTP conditional-response helpers
+ETag / Cache-Control support for idempotent GET endpoints
+
+Black box interface:
+- make_etag(body) -> str
+- conditional_response(request, body, cache_control, etag=None) -> Response
+
+A client (or reverse proxy) that sends back a matching If-None-Match gets an
+empty 304 instead of the full JSON body.
+"""
+import hashlib
+from typing import Optional
+
+import orjson
+from fastapi import Request, Response, status
+
+
+def make_etag(body: bytes) -> str:
+    """Build a weak ETag from the serialized response body"""
+    return f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def encode_json(payload) -> bytes:
+    """Serialize a JSON-compatible payload with orjson"""
+    return orjson.dumps(payload)
+
+
+def conditional_response(
+    request: Request,
+    body: bytes,
+    cache_control: str,
+    etag: Optional[str] = None
+) -> Response:
+    """
+    Return 304 if If-None-Match matches the body's ETag, else the JSON body.
+
+    Args:
+        request: Incoming request (for If-None-Match)
+        body: Serialized JSON response body
+        cache_control: Cache-Control header value
+        etag: Precomputed ETag (computed from body if omitted)
+
+    Returns:
+        304 Response without body, or 200 JSON Response with ETag headers
+    """
+    etag = etag or make_etag(body)
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -3,8 +3,10 @@ Async PostgreSQL Connection Management
 Following SQLAlchemy 2.0 + FastAPI best practices (October 2025)
 """
 import os
+import logging
 from typing import AsyncGenerator
 
+import orjson
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -12,6 +14,10 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine
 )
 from sqlalchemy import exc
+from sqlalchemy.pool import NullPool
+
+
+logger = logging.getLogger("notelens.database")
 
 
 # ============================================================================
@@ -70,6 +76,11 @@ def get_engine() -> AsyncEngine:
     Engine is created once and reused across the application lifecycle.
     Uses connection pooling for optimal performance.
 
+    Set DB_USE_PGBOUNCER=true when connecting through PgBouncer in
+    transaction mode: PgBouncer then owns pooling, so the engine uses
+    NullPool and disables asyncpg's prepared statement cache (prepared
+    statements don't survive PgBouncer switching server connections).
+
     Returns:
         AsyncEngine: SQLAlchemy async engine instance
     """
@@ -78,20 +89,38 @@ def get_engine() -> AsyncEngine:
     if _async_engine is None:
         database_url = get_database_url()
 
+        if os.getenv("DB_USE_PGBOUNCER", "false").lower() == "true":
+            # External pooler: open/close a connection per checkout
+            pool_kwargs = {
+                "poolclass": NullPool,
+                "connect_args": {"statement_cache_size": 0},
+            }
+        else:
+            # In-process pool sized for concurrent requests (defaults of
+            # 5 + 10 overflow exhaust quickly and cause QueuePool timeouts).
+            # The 20 + 10 budget is split across uvicorn workers so N workers
+            # stay well below Postgres' default max_connections=100.
+            workers = max(int(os.getenv("WEB_CONCURRENCY", "1")), 1)
+            pool_kwargs = {
+                "pool_size": max(20 // workers, 2),  # Base number of connections
+                "max_overflow": max(10 // workers, 1),  # Additional connections when pool is exhausted
+                "pool_timeout": 30,  # Timeout for getting connection from pool (seconds)
+                "pool_recycle": 1800,  # Recycle connections after 30 minutes
+            }
+
         _async_engine = create_async_engine(
             database_url,
-            # Connection pool settings
-            pool_size=5,  # Base number of connections
-            max_overflow=10,  # Additional connections when pool is exhausted
-            pool_timeout=30,  # Timeout for getting connection from pool (seconds)
-            pool_recycle=3600,  # Recycle connections after 1 hour
+            **pool_kwargs,
             pool_pre_ping=True,  # Verify connections before using them
+            # orjson for JSON columns (ai_tools, agent_execution_order)
+            json_serializer=lambda obj: orjson.dumps(obj).decode(),
+            json_deserializer=orjson.loads,
             # Performance settings
             echo=False,  # Set to True for SQL query logging (debug only)
             echo_pool=False,  # Set to True for connection pool logging (debug only)
         )
 
-        print(f"✅ Database engine created: {database_url.split('@')[-1]}")
+        logger.info("Database engine created: %s", database_url.split('@')[-1])
 
     return _async_engine
 
@@ -125,7 +154,7 @@ def get_session_maker() -> async_sessionmaker[AsyncSession]:
             autocommit=False,  # Explicit transaction control
         )
 
-        print("✅ Session factory created")
+        logger.info("Session factory created")
 
     return _session_factory
 
@@ -174,7 +203,7 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.commit()
         except exc.SQLAlchemyError as error:
             await session.rollback()
-            print(f"❌ Database error: {error}")
+            logger.error("Database error: %s", error)
             raise
         finally:
             await session.close()
@@ -206,4 +235,4 @@ async def dispose_engine() -> None:
     if _async_engine is not None:
         await _async_engine.dispose()
         _async_engine = None
-        print("✅ Database engine disposed")
+        logger.info("Database engine disposed")
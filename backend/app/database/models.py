@@ -6,8 +6,8 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import DateTime, String, Integer, Text, JSON, func
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import DateTime, String, Integer, Text, JSON, Index, func
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
@@ -122,6 +122,8 @@ class Video(UUIDPrimaryKeyMixin, TimestampMixin, Base):
 
     last_processed_at: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=True,
         comment="Timestamp of most recent processing"
     )
@@ -168,8 +170,9 @@ class ProcessingResult(UUIDPrimaryKeyMixin, TimestampMixin, Base):
     )
 
     # Agent 3 output: AI tools (GPT-4o-mini)
+    # JSONB (not JSON) so tool lookups can use the GIN index below
     ai_tools: Mapped[dict] = mapped_column(
-        JSON,
+        JSONB,
         nullable=False,
         comment="JSON array of AI tools extracted by GPT-4o-mini"
     )
@@ -203,3 +206,19 @@ class ProcessingResult(UUIDPrimaryKeyMixin, TimestampMixin, Base):
 
     def __repr__(self) -> str:
         return f"<ProcessingResult(id={self.id}, video_id={self.video_id}, tools_count={self.ai_tools_count})>"
+
+
+# History list ordering (newest first); backs LIMIT/OFFSET and keyset pagination
+Index(
+    "idx_pr_created_id",
+    ProcessingResult.created_at.desc(),
+    ProcessingResult.id.desc()
+)
+
+# Tool containment queries, e.g. ai_tools @> '[{"tool_name": "LangChain"}]'
+Index(
+    "idx_pr_tools_gin",
+    ProcessingResult.ai_tools,
+    postgresql_using="gin",
+    postgresql_ops={"ai_tools": "jsonb_path_ops"}
+)
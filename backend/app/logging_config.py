@@ -0,0 +1,72 @@
+"""
+Logging configuration for NoteLens
+Non-blocking logging via QueueHandler + QueueListener
+
+Black box interface:
+- setup_logging(): attach queue handler to the "notelens" logger, start listener
+- shutdown_logging(): flush pending records and stop listener
+
+Request handlers only enqueue log records; formatting (including
+logger.exception tracebacks) and the blocking stderr write happen on the
+listener's background thread, off the event loop.
+Modules log through child loggers: logging.getLogger("notelens.<module>").
+"""
+import logging
+import os
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+from typing import Optional
+
+
+LOGGER_NAME = "notelens"
+LOG_FORMAT = "%(asctime)s %(levelname)s [%(name)s] %(message)s"
+
+_listener: Optional[QueueListener] = None
+
+
+class _DeferredFormatQueueHandler(QueueHandler):
+    """
+    QueueHandler that enqueues records unformatted.
+
+    The stock prepare() formats the message and traceback on the calling
+    thread so records can be pickled; the queue here is in-process, so
+    formatting is left to the listener's handler.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def setup_logging() -> None:
+    """
+    Configure the "notelens" logger (idempotent).
+
+    Log level is read from LOG_LEVEL environment variable (default: INFO).
+    """
+    global _listener
+
+    if _listener is not None:
+        return
+
+    log_queue: SimpleQueue = SimpleQueue()
+
+    stream_handler = logging.StreamHandler(sys.stderr)
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+
+    logger = logging.getLogger(LOGGER_NAME)
+    logger.addHandler(_DeferredFormatQueueHandler(log_queue))
+    logger.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+    logger.propagate = False
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the listener thread"""
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -11,22 +11,25 @@ FastAPI application following October 2025 best practices:
 """
 import os
 import time
-import json
+import uuid
+import orjson
 import asyncio
+import logging
 from contextlib import asynccontextmanager
-from typing import Dict, Annotated, AsyncGenerator, Optional
+from typing import Dict, List, Annotated, AsyncGenerator, Optional
 from datetime import datetime, timedelta, timezone
 
 from fastapi import FastAPI, HTTPException, status, Depends, Request, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 from sse_starlette import EventSourceResponse
 from dotenv import load_dotenv
 from psycopg_pool import AsyncConnectionPool
 from psycopg.rows import dict_row
 from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, desc, and_
+from sqlalchemy import select, insert, update, desc, and_, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from app.models import (
     ExtractRequest,
@@ -37,18 +40,27 @@ from app.models import (
     ProcessedResult,
     MultiAgentResult,
     MultiAgentResponse,
+    BatchProcessRequest,
+    BatchItemResult,
+    BatchProcessResponse,
     AITool,
     VideoMetadata
 )
-from app.tools import YouTubeTranscriptExtractor, LectureSummarizer, AIToolExtractor
+from app.tools import YouTubeTranscriptExtractor, extract_video_id
 from app.agents import MultiAgentOrchestrator
 from app.database import get_db, dispose_engine
 from app.database.connection import get_database_url
 from app.database.models import Video, ProcessingResult
+from app.api.http_cache import conditional_response, encode_json, make_etag
+from app.logging_config import setup_logging, shutdown_logging
 
 # Load environment variables
 load_dotenv()
 
+# Non-blocking logging (QueueHandler -> background QueueListener)
+setup_logging()
+logger = logging.getLogger("notelens.api")
+
 
 # ============================================================================
 # Lifespan context manager for startup/shutdown events
@@ -62,17 +74,17 @@ async def lifespan(app: FastAPI):
     Sets up:
     - PostgreSQL connection pool for LangGraph checkpointing
     - AsyncPostgresSaver for agent state persistence
+    - Shared MultiAgentOrchestrator (long-lived LLM clients)
     - Database engine cleanup on shutdown
     """
     # Startup
-    print("🚀 LectureFlow API starting up...")
-    print(f"📍 Environment: {os.getenv('ENV', 'development')}")
+    logger.info("LectureFlow API starting up (environment: %s)", os.getenv('ENV', 'development'))
 
     # Get database URL and convert for psycopg (remove +asyncpg)
     db_url = get_database_url()
     psycopg_url = db_url.replace("+asyncpg", "")  # psycopg doesn't use +asyncpg
 
-    print(f"📊 Connecting to database...")
+    logger.info("Connecting to database")
 
     # Create PostgreSQL connection pool for LangGraph checkpointing
     async with AsyncConnectionPool(
@@ -89,18 +101,23 @@ async def lifespan(app: FastAPI):
 
         # Create checkpoint tables (only runs once, idempotent)
         await checkpointer.setup()
-        print("✅ LangGraph checkpointer initialized")
+        logger.info("LangGraph checkpointer initialized")
 
         # Store checkpointer in app state for use in endpoints
         app.state.checkpointer = checkpointer
 
+        # Build orchestrator once so tool clients and the compiled graph are reused
+        app.state.orchestrator = MultiAgentOrchestrator()
+        logger.info("Multi-agent orchestrator initialized")
+
         yield
 
     # Shutdown
-    print("👋 LectureFlow API shutting down...")
-    print("🗄️  Disposing database engine...")
+    logger.info("LectureFlow API shutting down, closing LLM clients and database engine")
+    await app.state.orchestrator.aclose()
     await dispose_engine()
-    print("✅ Cleanup complete")
+    logger.info("Cleanup complete")
+    shutdown_logging()
 
 
 # ============================================================================
@@ -110,7 +127,9 @@ app = FastAPI(
     title="LectureFlow API",
     description="AI-powered YouTube lecture notes generator with multi-agent orchestration",
     version="0.1.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # orjson (Rust/C) encoder for response bodies instead of stdlib json
+    default_response_class=ORJSONResponse
 )
 
 
@@ -142,6 +161,23 @@ app.include_router(history_router)
 app.include_router(presets_router)
 
 
+# ============================================================================
+# Dependencies
+# ============================================================================
+def get_orchestrator(request: Request) -> MultiAgentOrchestrator:
+    """FastAPI dependency returning the shared orchestrator created in lifespan"""
+    return request.app.state.orchestrator
+
+
+def get_transcript_extractor(request: Request) -> YouTubeTranscriptExtractor:
+    """
+    FastAPI dependency returning the orchestrator's transcript extractor.
+
+    Reuses its pooled HTTP session instead of opening a second one.
+    """
+    return request.app.state.orchestrator.transcript_extractor
+
+
 # ============================================================================
 # Global Exception Handler
 # ============================================================================
@@ -151,8 +187,8 @@ async def global_exception_handler(request, exc: Exception):
     Catch-all exception handler to prevent server crashes
     and provide consistent error responses.
     """
-    print(f"❌ Unhandled exception: {exc}")
-    return JSONResponse(
+    logger.error("Unhandled exception: %s", exc, exc_info=exc)
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "success": False,
@@ -166,30 +202,43 @@ async def global_exception_handler(request, exc: Exception):
 # API Endpoints
 # ============================================================================
 
+# Static bodies: serialized and hashed once, served with an ETag
+_ROOT_BODY = encode_json(HealthResponse(
+    status="healthy",
+    message="LectureFlow API is running. Visit /docs for API documentation."
+).model_dump())
+_ROOT_ETAG = make_etag(_ROOT_BODY)
+
+_HEALTH_BODY = encode_json(HealthResponse(
+    status="healthy",
+    message="All systems operational"
+).model_dump())
+_HEALTH_ETAG = make_etag(_HEALTH_BODY)
+
+HEALTH_CACHE_CONTROL = "public, max-age=5"
+
+
 @app.get("/", response_model=HealthResponse)
-async def root() -> HealthResponse:
+async def root(request: Request) -> Response:
     """
     Root endpoint - health check and API info.
     """
-    return HealthResponse(
-        status="healthy",
-        message="LectureFlow API is running. Visit /docs for API documentation."
-    )
+    return conditional_response(request, _ROOT_BODY, HEALTH_CACHE_CONTROL, _ROOT_ETAG)
 
 
 @app.get("/health", response_model=HealthResponse)
-async def health_check() -> HealthResponse:
+async def health_check(request: Request) -> Response:
     """
     Health check endpoint for monitoring and deployment verification.
     """
-    return HealthResponse(
-        status="healthy",
-        message="All systems operational"
-    )
+    return conditional_response(request, _HEALTH_BODY, HEALTH_CACHE_CONTROL, _HEALTH_ETAG)
 
 
 @app.post("/api/extract", response_model=ExtractResponse, status_code=status.HTTP_200_OK)
-async def extract_transcript(request: ExtractRequest) -> ExtractResponse:
+async def extract_transcript(
+    request: ExtractRequest,
+    transcript_extractor: Annotated[YouTubeTranscriptExtractor, Depends(get_transcript_extractor)]
+) -> ORJSONResponse:
     """
     Extract transcript and metadata from a YouTube video.
 
@@ -198,6 +247,7 @@ async def extract_transcript(request: ExtractRequest) -> ExtractResponse:
 
     Args:
         request: ExtractRequest containing video_url
+        transcript_extractor: Shared transcript extractor (dependency injection)
 
     Returns:
         ExtractResponse with transcript data or error
@@ -206,18 +256,19 @@ async def extract_transcript(request: ExtractRequest) -> ExtractResponse:
         HTTPException: If extraction fails
     """
     try:
-        # Initialize extractor
-        extractor = YouTubeTranscriptExtractor()
+        # Extract transcript (blocking I/O runs in a worker thread via aextract)
+        transcript_data = await transcript_extractor.aextract(request.video_url)
 
-        # Extract transcript (blocking I/O - will optimize in later phases)
-        transcript_data = extractor.extract(request.video_url)
-
-        return ExtractResponse(
+        response = ExtractResponse.model_construct(
             success=True,
             data=transcript_data,
             error=None
         )
 
+        # Chunks were validated on construction: dump once and encode with
+        # orjson instead of FastAPI re-validating the response model
+        return ORJSONResponse(content=response.model_dump())
+
     except ValueError as e:
         # Client error - invalid URL or no transcript
         raise HTTPException(
@@ -227,18 +278,163 @@ async def extract_transcript(request: ExtractRequest) -> ExtractResponse:
 
     except Exception as e:
         # Server error - unexpected failure
-        print(f"❌ Extraction error: {e}")
+        logger.exception("Extraction error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to extract transcript: {str(e)}"
         )
 
 
+# ============================================================================
+# Serialization Helper
+# ============================================================================
+
+def sse_json(payload) -> str:
+    """Encode an SSE event payload with orjson (large transcript/notes frames)"""
+    return orjson.dumps(payload).decode()
+
+
+# ============================================================================
+# Persistence Helper
+# ============================================================================
+
+async def upsert_video(db: AsyncSession, video_metadata: VideoMetadata) -> uuid.UUID:
+    """
+    Insert or update the Video record and return its UUID.
+
+    Single INSERT ... ON CONFLICT DO UPDATE ... RETURNING round-trip:
+    no SELECT-then-INSERT race and no flush needed to obtain the id.
+
+    Args:
+        db: Database session
+        video_metadata: Metadata of the processed video
+
+    Returns:
+        UUID primary key of the video row
+    """
+    # last_processed_at uses the Postgres clock (server_default on insert)
+    upsert_stmt = (
+        pg_insert(Video)
+        .values(
+            video_id=video_metadata.video_id,
+            video_url=video_metadata.video_url,
+            title=video_metadata.video_title,
+            channel_name=video_metadata.channel_name,
+            duration=video_metadata.duration,
+            times_processed=1
+        )
+        .on_conflict_do_update(
+            index_elements=[Video.video_id],
+            set_={
+                "times_processed": Video.times_processed + 1,
+                "last_processed_at": func.now(),
+                "title": video_metadata.video_title,
+                "updated_at": func.now()
+            }
+        )
+        .returning(Video.id)
+    )
+    return (await db.execute(upsert_stmt)).scalar_one()
+
+
+def build_processing_row(
+    final_state: dict,
+    video_uuid: uuid.UUID,
+    processing_time: float
+) -> dict:
+    """Build ProcessingResult column values from a final orchestrator state"""
+    ai_tools = final_state["ai_tools"]
+    return {
+        "video_id": video_uuid,  # UUID foreign key
+        "transcript_text": final_state["transcript"],
+        "transcript_length": len(final_state["transcript"]),
+        "lecture_notes": final_state["lecture_notes"],
+        "ai_tools": [tool.model_dump(mode="json") for tool in ai_tools],  # JSON
+        "ai_tools_count": len(ai_tools),
+        "processing_time_seconds": round(processing_time, 2),
+        "agent_execution_order": list(final_state["agent_execution_order"])
+    }
+
+
+async def save_processing_result(
+    db: AsyncSession,
+    final_state: dict,
+    processing_time: float
+) -> None:
+    """
+    Save a multi-agent result to the database.
+
+    Upserts the Video record (RETURNING its id), then adds a ProcessingResult
+    row that is inserted at commit - one statement each, no intermediate flush.
+    Commit is handled by the get_db dependency.
+
+    Args:
+        db: Database session
+        final_state: Final orchestrator state for one video
+        processing_time: Time taken to process (seconds)
+    """
+    video_uuid = await upsert_video(db, final_state["video_metadata"])
+    db.add(ProcessingResult(**build_processing_row(final_state, video_uuid, processing_time)))
+
+    # Commit transaction (handled by get_db dependency)
+    logger.info("Saved processing results to database")
+
+
+async def save_processing_results(
+    db: AsyncSession,
+    final_states: List[dict],
+    processing_time: float
+) -> None:
+    """
+    Save several multi-agent results to the database.
+
+    Videos are upserted one by one (a single multi-row ON CONFLICT statement
+    fails if the same video appears twice), then all ProcessingResult rows
+    go out as one executemany INSERT.
+    Commit is handled by the get_db dependency.
+
+    Args:
+        db: Database session
+        final_states: Final orchestrator states of successfully processed videos
+        processing_time: Time taken to process (seconds)
+    """
+    if not final_states:
+        return
+
+    rows = []
+    for final_state in final_states:
+        video_uuid = await upsert_video(db, final_state["video_metadata"])
+        rows.append(build_processing_row(final_state, video_uuid, processing_time))
+
+    await db.execute(insert(ProcessingResult), rows)
+
+    logger.info("Saved %d processing results to database", len(rows))
+
+
+async def record_cached_hit(db: AsyncSession, video: Video) -> None:
+    """
+    Bump processing counters for a video served from cache.
+
+    Uses an atomic UPDATE (times_processed + 1) so concurrent hits don't
+    lose increments. Commit is handled by the get_db dependency.
+
+    Args:
+        db: Database session
+        video: Cached Video record
+    """
+    await db.execute(
+        update(Video)
+        .where(Video.id == video.id)
+        .values(times_processed=Video.times_processed + 1)  # last_processed_at via onupdate
+    )
+
+
 @app.post("/api/process", response_model=MultiAgentResponse, status_code=status.HTTP_200_OK)
 async def process_video(
     request: ProcessRequest,
-    db: Annotated[AsyncSession, Depends(get_db)]
-) -> MultiAgentResponse:
+    db: Annotated[AsyncSession, Depends(get_db)],
+    orchestrator: Annotated[MultiAgentOrchestrator, Depends(get_orchestrator)]
+) -> ORJSONResponse:
     """
     Process a YouTube video with multi-agent orchestration and save to database.
 
@@ -250,10 +446,13 @@ async def process_video(
     - Uses LangGraph checkpointing for state persistence
 
     Agents 2 and 3 run in parallel for optimal performance.
+    A result cached within the last 7 days is returned without any LLM
+    calls unless request.force_refresh is set.
 
     Args:
-        request: ProcessRequest containing video_url
+        request: ProcessRequest containing video_url and force_refresh
         db: Database session (dependency injection)
+        orchestrator: Shared multi-agent orchestrator (dependency injection)
 
     Returns:
         MultiAgentResponse with lecture notes, AI tools, and metadata
@@ -261,96 +460,92 @@ async def process_video(
     Raises:
         HTTPException: If processing fails
     """
-    from app.database.models import Video, ProcessingResult
-    from sqlalchemy import select
-    from datetime import datetime, timezone
-
     start_time = time.time()
 
     try:
-        print(f"📹 Processing video with multi-agent orchestration: {request.video_url}")
+        # ====================================================================
+        # Cache fast path: reuse the latest result for this video_id
+        # ====================================================================
 
-        # Initialize multi-agent orchestrator
-        orchestrator = MultiAgentOrchestrator()
+        if not request.force_refresh:
+            cached_result = await get_cached_result(request.video_url, cache_days=7, db=db)
+            if cached_result:
+                processing_result, video = cached_result
+                await record_cached_hit(db, video)
+                # Stored rows were validated on write: construct without
+                # validation and return directly (no response_model re-validation)
+                response = MultiAgentResponse.model_construct(
+                    success=True,
+                    data=MultiAgentResult.model_construct(
+                        video_metadata=VideoMetadata.model_construct(
+                            video_id=video.video_id,
+                            video_title=video.title,
+                            video_url=video.video_url,
+                            channel_name=video.channel_name,
+                            duration=video.duration
+                        ),
+                        lecture_notes=processing_result.lecture_notes,
+                        ai_tools=[
+                            AITool.model_construct(**tool)
+                            for tool in processing_result.ai_tools
+                        ],
+                        processing_time=processing_result.processing_time_seconds,
+                        agent_execution_order=processing_result.agent_execution_order
+                    ),
+                    error=None
+                )
+                return ORJSONResponse(content=response.model_dump())
+
+        logger.info("Processing video with multi-agent orchestration: %s", request.video_url)
 
         # Process through LangGraph (handles all agents automatically)
-        final_state = orchestrator.process(request.video_url)
+        final_state = await orchestrator.aprocess(
+            request.video_url,
+            force_refresh=request.force_refresh
+        )
 
         # Calculate processing time
         processing_time = time.time() - start_time
 
-        # Convert state dict to Pydantic models
-        video_metadata = VideoMetadata(**final_state["video_metadata"])
-        ai_tools = [AITool(**tool) for tool in final_state["ai_tools"]]
+        # Orchestrator state already holds validated Pydantic models
+        video_metadata = final_state["video_metadata"]
+        ai_tools = final_state["ai_tools"]
 
-        print(f"✅ Multi-agent processing complete in {processing_time:.2f}s")
-        print(f"   - Lecture notes: {len(final_state['lecture_notes'])} chars")
-        print(f"   - AI tools extracted: {len(ai_tools)}")
+        logger.info(
+            "Multi-agent processing complete in %.2fs (notes: %d chars, AI tools: %d)",
+            processing_time,
+            len(final_state["lecture_notes"]),
+            len(ai_tools)
+        )
 
         # ====================================================================
         # Save to database (Phase 3)
         # ====================================================================
 
-        # Check if video already exists in database
-        result_query = await db.execute(
-            select(Video).where(Video.video_id == video_metadata.video_id)
-        )
-        video_record = result_query.scalar_one_or_none()
-
-        if video_record:
-            # Update existing video
-            video_record.times_processed += 1
-            video_record.last_processed_at = datetime.now(timezone.utc)
-            print(f"📊 Updated existing video (processed {video_record.times_processed} times)")
-        else:
-            # Create new video record
-            video_record = Video(
-                video_id=video_metadata.video_id,
-                video_url=video_metadata.video_url,
-                title=video_metadata.video_title,
-                channel_name=video_metadata.channel_name,
-                duration=video_metadata.duration,
-                times_processed=1,
-                last_processed_at=datetime.now(timezone.utc)
-            )
-            db.add(video_record)
-            await db.flush()  # Get the UUID
-            print(f"💾 Created new video record")
-
-        # Create processing result record
-        processing_record = ProcessingResult(
-            video_id=video_record.id,  # UUID foreign key
-            transcript_text=final_state["transcript"],
-            transcript_length=len(final_state["transcript"]),
-            lecture_notes=final_state["lecture_notes"],
-            ai_tools=[tool.model_dump() for tool in ai_tools],  # JSON
-            ai_tools_count=len(ai_tools),
-            processing_time_seconds=round(processing_time, 2),
-            agent_execution_order=final_state["agent_execution_order"]
-        )
-        db.add(processing_record)
-
-        # Commit transaction (handled by get_db dependency)
-        print(f"💾 Saved processing results to database")
+        await save_processing_result(db, final_state, processing_time)
 
         # ====================================================================
         # Build API response
         # ====================================================================
 
-        result = MultiAgentResult(
+        # State already holds validated models: construct without re-validating
+        result = MultiAgentResult.model_construct(
             video_metadata=video_metadata,
             lecture_notes=final_state["lecture_notes"],
             ai_tools=ai_tools,
             processing_time=round(processing_time, 2),
-            agent_execution_order=final_state["agent_execution_order"]
+            agent_execution_order=list(final_state["agent_execution_order"])
         )
 
-        return MultiAgentResponse(
+        response = MultiAgentResponse.model_construct(
             success=True,
             data=result,
             error=None
         )
 
+        # Returning a Response bypasses FastAPI's response_model re-validation
+        return ORJSONResponse(content=response.model_dump())
+
     except ValueError as e:
         # Client error - invalid URL or no transcript
         raise HTTPException(
@@ -360,15 +555,96 @@ async def process_video(
 
     except Exception as e:
         # Server error - unexpected failure
-        print(f"❌ Processing error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Processing failed for %s", request.video_url)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to process video: {str(e)}"
         )
 
 
+@app.post("/api/process/batch", response_model=BatchProcessResponse, status_code=status.HTTP_200_OK)
+async def process_video_batch(
+    request: BatchProcessRequest,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    orchestrator: Annotated[MultiAgentOrchestrator, Depends(get_orchestrator)]
+) -> ORJSONResponse:
+    """
+    Process several YouTube videos concurrently and save each result to database.
+
+    All videos share one event loop, so their LLM calls interleave instead of
+    running back to back (useful for warming up preset videos).
+    A failing video does not fail the batch; its item carries the error.
+
+    Args:
+        request: BatchProcessRequest containing video_urls and max_concurrency
+        db: Database session (dependency injection)
+        orchestrator: Shared multi-agent orchestrator (dependency injection)
+
+    Returns:
+        BatchProcessResponse with one BatchItemResult per input URL
+    """
+    start_time = time.time()
+
+    try:
+        logger.info("Processing batch of %d videos", len(request.video_urls))
+
+        final_states = await orchestrator.aprocess_batch(
+            request.video_urls,
+            max_concurrency=request.max_concurrency
+        )
+
+        # Per-video timings are not tracked inside a batch; record batch wall time
+        processing_time = time.time() - start_time
+
+        # Persist all successful results in one batched INSERT
+        await save_processing_results(
+            db,
+            [state for state in final_states if not isinstance(state, Exception)],
+            processing_time
+        )
+
+        items = []
+        for video_url, final_state in zip(request.video_urls, final_states):
+            if isinstance(final_state, Exception):
+                items.append(BatchItemResult(
+                    video_url=video_url,
+                    success=False,
+                    error=str(final_state)
+                ))
+                continue
+
+            items.append(BatchItemResult(
+                video_url=video_url,
+                success=True,
+                data=MultiAgentResult.model_construct(
+                    video_metadata=final_state["video_metadata"],
+                    lecture_notes=final_state["lecture_notes"],
+                    ai_tools=final_state["ai_tools"],
+                    processing_time=round(processing_time, 2),
+                    agent_execution_order=list(final_state["agent_execution_order"])
+                )
+            ))
+
+        logger.info("Batch processing complete in %.2fs", processing_time)
+
+        response = BatchProcessResponse.model_construct(
+            success=True,
+            data=items,
+            error=None
+        )
+
+        # Returning a Response bypasses FastAPI's response_model re-validation
+        return ORJSONResponse(content=response.model_dump())
+
+    except Exception as e:
+        # Server error - unexpected failure
+        logger.exception("Batch processing error: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to process batch: {str(e)}"
+        )
+
+
 # ============================================================================
 # Cache Helper Function (Smart Caching - Phase 5.5)
 # ============================================================================
@@ -396,9 +672,10 @@ async def get_cached_result(
         return None
 
     try:
-        # Extract video ID from URL
-        extractor = YouTubeTranscriptExtractor()
-        video_id = extractor._extract_video_id(video_url)
+        # Extract video ID from URL (pre-compiled regex, no network call)
+        video_id = extract_video_id(video_url)
+        if not video_id:
+            return None
 
         # Calculate cache cutoff time (timezone-aware for PostgreSQL)
         cache_cutoff = datetime.now(timezone.utc) - timedelta(days=cache_days)
@@ -422,14 +699,14 @@ async def get_cached_result(
 
         if row:
             processing_result, video = row
-            print(f"💾 Cache HIT: Found result from {processing_result.created_at}")
+            logger.info("Cache HIT: found result from %s", processing_result.created_at)
             return (processing_result, video)
         else:
-            print(f"❌ Cache MISS: No recent result found")
+            logger.info("Cache MISS: no recent result found")
             return None
 
     except Exception as e:
-        print(f"⚠️  Cache check error: {e}")
+        logger.warning("Cache check error: %s", e)
         return None
 
 
@@ -438,7 +715,8 @@ async def process_video_stream(
     request: Request,
     video_url: str,
     force: bool = Query(False, description="Force reprocessing even if cached result exists"),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    orchestrator: MultiAgentOrchestrator = Depends(get_orchestrator)
 ):
     """
     Stream video processing with ChatGPT-style real-time updates.
@@ -449,7 +727,7 @@ async def process_video_stream(
     - If not cached or force=True: processes fresh (uses API credits)
     - Streams thinking process status updates
     - Streams lecture notes chunks as they're generated
-    - Returns AI tools when extraction completes
+    - Extracts AI tools concurrently and returns them when extraction completes
 
     Yields SSE events:
     - {type: "cache", data: {from_cache: true, cached_at: "..."}} (if cached)
@@ -465,6 +743,7 @@ async def process_video_stream(
         video_url: YouTube video URL (query parameter)
         force: Force reprocessing even if cached (default: False)
         db: Database session (injected)
+        orchestrator: Shared multi-agent orchestrator (injected)
 
     Returns:
         EventSourceResponse with SSE stream
@@ -472,18 +751,17 @@ async def process_video_stream(
     async def event_generator() -> AsyncGenerator[dict, None]:
         """Generate SSE events for video processing"""
         try:
-            print(f"\n🎬 Starting stream processing for: {video_url}")
-            print(f"🔧 Force reprocess: {force}")
+            logger.info("Starting stream processing for: %s (force: %s)", video_url, force)
 
             # ================================================================
             # Step 0: Check Cache (Smart Caching)
             # ================================================================
             cached_result = None
             if not force:
-                print("💾 Checking cache...")
+                logger.debug("Checking cache")
                 yield {
                     "event": "message",
-                    "data": json.dumps({"type": "status", "data": "Checking cache..."})
+                    "data": sse_json({"type": "status", "data": "Checking cache..."})
                 }
 
                 cached_result = await get_cached_result(video_url, cache_days=7, db=db)
@@ -496,12 +774,12 @@ async def process_video_stream(
                 cache_age = datetime.now(timezone.utc) - processing_result.created_at
                 cache_hours = cache_age.total_seconds() / 3600
 
-                print(f"✅ Using cached result (age: {cache_hours:.1f} hours)")
+                logger.info("Using cached result (age: %.1f hours)", cache_hours)
 
                 # Send cache indicator
                 yield {
                     "event": "message",
-                    "data": json.dumps({
+                    "data": sse_json({
                         "type": "cache",
                         "data": {
                             "from_cache": True,
@@ -514,7 +792,7 @@ async def process_video_stream(
                 # Send metadata
                 yield {
                     "event": "message",
-                    "data": json.dumps({
+                    "data": sse_json({
                         "type": "metadata",
                         "data": {
                             "video_id": video.video_id,
@@ -534,7 +812,7 @@ async def process_video_stream(
                     chunk = notes[i:i + chunk_size]
                     yield {
                         "event": "message",
-                        "data": json.dumps({"type": "chunk", "data": chunk})
+                        "data": sse_json({"type": "chunk", "data": chunk})
                     }
                     # Small delay to simulate streaming (optional)
                     await asyncio.sleep(0.02)
@@ -542,37 +820,37 @@ async def process_video_stream(
                 # Notes complete
                 yield {
                     "event": "message",
-                    "data": json.dumps({"type": "notes_complete"})
+                    "data": sse_json({"type": "notes_complete"})
                 }
 
                 # Send AI tools
                 yield {
                     "event": "message",
-                    "data": json.dumps({
+                    "data": sse_json({
                         "type": "tools",
                         "data": processing_result.ai_tools
                     })
                 }
 
                 # Complete
-                print("🎉 Cached stream complete!\n")
+                logger.info("Cached stream complete")
                 yield {
                     "event": "message",
-                    "data": json.dumps({"type": "complete"})
+                    "data": sse_json({"type": "complete"})
                 }
                 return
 
             # ================================================================
             # FRESH PATH: Process new (API calls)
             # ================================================================
-            print("🔄 Processing fresh (no cache or forced reprocess)")
+            logger.info("Processing fresh (no cache or forced reprocess)")
 
             # Send cache indicator (not cached)
             if force:
-                print("💪 Force reprocess requested")
+                logger.info("Force reprocess requested")
                 yield {
                     "event": "message",
-                    "data": json.dumps({
+                    "data": sse_json({
                         "type": "cache",
                         "data": {"from_cache": False, "reason": "forced_reprocess"}
                     })
@@ -581,116 +859,98 @@ async def process_video_stream(
             # ================================================================
             # Step 1: Fetch Transcript
             # ================================================================
-            print("📹 Step 1: Fetching transcript...")
-            yield {
-                "event": "message",
-                "data": json.dumps({"type": "status", "data": "Fetching transcript..."})
-            }
-
-            extractor = YouTubeTranscriptExtractor()
-            transcript_data = extractor.extract(video_url)
-            print(f"✅ Transcript fetched: {len(transcript_data.full_text)} chars")
-
-            # Send video metadata and transcript
+            logger.info("Step 1: Fetching transcript")
             yield {
                 "event": "message",
-                "data": json.dumps({
-                    "type": "metadata",
-                    "data": {
-                        **transcript_data.metadata.model_dump(),
-                        "transcript": transcript_data.full_text
-                    }
-                })
+                "data": sse_json({"type": "status", "data": "Fetching transcript..."})
             }
 
-            # Check for disconnect
-            if await request.is_disconnected():
-                return
-
             # ================================================================
-            # Step 2: Stream Lecture Notes Generation
+            # Steps 2 & 3: Stream lecture notes while AI tools are extracted
             # ================================================================
-            print("📝 Step 2: Streaming lecture notes generation...")
-            yield {
-                "event": "message",
-                "data": json.dumps({"type": "status", "data": "Generating lecture notes..."})
-            }
-
-            summarizer = LectureSummarizer()
+            # The orchestrator runs Agents 2 and 3 concurrently; note chunks
+            # arrive on the custom stream, agent results on the updates stream
             chunk_count = 0
 
-            # Stream lecture notes chunks
-            async for chunk in summarizer.summarize_stream(
-                transcript=transcript_data.full_text,
-                video_title=transcript_data.metadata.video_title
-            ):
+            async for mode, payload in orchestrator.astream(video_url, force_refresh=force):
                 # Check for disconnect
                 if await request.is_disconnected():
-                    print("⚠️  Client disconnected")
+                    logger.warning("Client disconnected")
                     return
 
-                chunk_count += 1
-                yield {
-                    "event": "message",
-                    "data": json.dumps({"type": "chunk", "data": chunk})
-                }
-
-            print(f"✅ Lecture notes streamed: {chunk_count} chunks")
+                if mode == "custom":
+                    chunk_count += 1
+                    yield {
+                        "event": "message",
+                        "data": sse_json(payload)
+                    }
+                    continue
+
+                for node_name, update in payload.items():
+                    if node_name == "fetch_transcript":
+                        logger.info("Transcript fetched: %d chars", len(update["transcript"]))
+
+                        # Send video metadata and transcript
+                        yield {
+                            "event": "message",
+                            "data": sse_json({
+                                "type": "metadata",
+                                "data": {
+                                    **update["video_metadata"].model_dump(),
+                                    "transcript": update["transcript"]
+                                }
+                            })
+                        }
+                        yield {
+                            "event": "message",
+                            "data": sse_json({
+                                "type": "status",
+                                "data": "Generating lecture notes and extracting AI tools..."
+                            })
+                        }
 
-            # Notify frontend that notes generation is complete
-            yield {
-                "event": "message",
-                "data": json.dumps({"type": "notes_complete"})
-            }
+                    elif node_name == "summarize":
+                        logger.info("Lecture notes streamed: %d chunks", chunk_count)
 
-            # ================================================================
-            # Step 3: Extract AI Tools
-            # ================================================================
-            print("🔧 Step 3: Extracting AI tools...")
-            yield {
-                "event": "message",
-                "data": json.dumps({"type": "status", "data": "Extracting AI tools..."})
-            }
+                        # Notify frontend that notes generation is complete
+                        yield {
+                            "event": "message",
+                            "data": sse_json({"type": "notes_complete"})
+                        }
 
-            tool_extractor = AIToolExtractor()
-            ai_tools = tool_extractor.extract(
-                transcript=transcript_data.full_text,
-                video_title=transcript_data.metadata.video_title
-            )
-            print(f"✅ AI tools extracted: {len(ai_tools)} tools found")
+                    elif node_name in ("extract_tools", "skip_extract_tools"):
+                        logger.info("AI tools extracted: %d tools found", len(update["ai_tools"]))
 
-            # Send complete tools list
-            yield {
-                "event": "message",
-                "data": json.dumps({
-                    "type": "tools",
-                    "data": [tool.model_dump() for tool in ai_tools]
-                })
-            }
+                        # Send complete tools list
+                        yield {
+                            "event": "message",
+                            "data": sse_json({
+                                "type": "tools",
+                                "data": [tool.model_dump() for tool in update["ai_tools"]]
+                            })
+                        }
 
             # ================================================================
             # Step 4: Complete
             # ================================================================
-            print("🎉 Stream processing complete!\n")
+            logger.info("Stream processing complete")
             yield {
                 "event": "message",
-                "data": json.dumps({"type": "complete"})
+                "data": sse_json({"type": "complete"})
             }
 
         except ValueError as e:
             # Client error
             yield {
                 "event": "error",
-                "data": json.dumps({"type": "error", "error": str(e)})
+                "data": sse_json({"type": "error", "error": str(e)})
             }
         except Exception as e:
             # Server error
-            print(f"❌ Streaming error: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Streaming error: %s", e)
             yield {
                 "event": "error",
-                "data": json.dumps({"type": "error", "error": f"Processing failed: {str(e)}"})
+                "data": sse_json({"type": "error", "error": f"Processing failed: {str(e)}"})
             }
 
     return EventSourceResponse(event_generator())
@@ -704,11 +964,19 @@ if __name__ == "__main__":
 
     port = int(os.getenv("PORT", 8000))
     host = os.getenv("HOST", "0.0.0.0")
+    # Each worker has its own DB pool (sized by WEB_CONCURRENCY in connection.py)
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
 
     uvicorn.run(
         "app.main:app",
         host=host,
         port=port,
-        reload=True,  # Auto-reload on code changes (dev only)
-        log_level="info"
+        reload=workers == 1,  # Auto-reload on code changes (single worker only)
+        log_level=os.getenv("LOG_LEVEL", "info").lower(),
+        # "auto" picks uvloop + httptools when installed (uvicorn[standard]),
+        # falling back to asyncio/h11 where they are not (e.g. Windows has no uvloop)
+        loop="auto",
+        http="auto",
+        # reload and multiple workers are mutually exclusive
+        workers=workers
     )
@@ -2,7 +2,7 @@
 Pydantic models for LectureFlow API
 """
 from typing import List, Optional
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, Field, HttpUrl, computed_field
 
 
 class TranscriptChunk(BaseModel):
@@ -25,7 +25,12 @@ class TranscriptData(BaseModel):
     """Complete transcript data with metadata"""
     metadata: VideoMetadata
     transcript_chunks: List[TranscriptChunk]
-    full_text: str = Field(..., description="Complete transcript as single text")
+
+    @computed_field(description="Complete transcript as single text")
+    @property
+    def full_text(self) -> str:
+        """Derived from chunks so the transcript text is not stored twice"""
+        return " ".join(chunk.text for chunk in self.transcript_chunks)
 
 
 class ExtractRequest(BaseModel):
@@ -53,6 +58,10 @@ class HealthResponse(BaseModel):
 class ProcessRequest(BaseModel):
     """Request model for processing a YouTube video"""
     video_url: str = Field(..., description="YouTube video URL")
+    force_refresh: bool = Field(
+        False,
+        description="Reprocess even if a recent cached result exists"
+    )
 
 
 class ProcessedResult(BaseModel):
@@ -102,6 +111,27 @@ class MultiAgentResponse(BaseModel):
     error: Optional[str] = None
 
 
+class BatchProcessRequest(BaseModel):
+    """Request model for processing several YouTube videos concurrently"""
+    video_urls: List[str] = Field(..., min_length=1, max_length=50, description="YouTube video URLs")
+    max_concurrency: int = Field(8, ge=1, le=32, description="Maximum videos processed at once")
+
+
+class BatchItemResult(BaseModel):
+    """Outcome for a single video in a batch"""
+    video_url: str
+    success: bool
+    data: Optional[MultiAgentResult] = None
+    error: Optional[str] = None
+
+
+class BatchProcessResponse(BaseModel):
+    """Response model for batch multi-agent video processing"""
+    success: bool
+    data: List[BatchItemResult] = Field(default_factory=list)
+    error: Optional[str] = None
+
+
 # ============================================================================
 # Phase 5: History API Models
 # ============================================================================
@@ -125,9 +155,16 @@ class HistoryListResponse(BaseModel):
     """Response model for history list endpoint"""
     success: bool
     data: Optional[List[HistoryItemSummary]] = None
-    total: int = Field(0, description="Total number of results")
+    total: Optional[int] = Field(
+        0,
+        description="Total number of results (None for cursor pages)"
+    )
     page: int = Field(1, description="Current page number")
     page_size: int = Field(20, description="Results per page")
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Opaque cursor for the next page (None on the last page)"
+    )
     error: Optional[str] = None
 
 
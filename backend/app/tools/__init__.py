@@ -1,12 +1,13 @@
 """
 Tools package for LectureFlow
 """
-from app.tools.youtube_tool import YouTubeTranscriptExtractor
+from app.tools.youtube_tool import YouTubeTranscriptExtractor, extract_video_id
 from app.tools.summarizer import LectureSummarizer
 from app.tools.tool_extractor import AIToolExtractor
 
 __all__ = [
     'YouTubeTranscriptExtractor',
+    'extract_video_id',
     'LectureSummarizer',
     'AIToolExtractor'
 ]
@@ -5,12 +5,29 @@ Uses Gemini 2.5 Flash for cost-effective, high-quality summarization
 Black box interface:
 - Input: Transcript text (string)
 - Output: Markdown-formatted lecture notes (string) OR async stream
+
+Very long transcripts (multi-hour lectures) are map-reduced: sections are
+summarized in parallel, then one reduce pass merges them into the notes.
 """
 import os
-from typing import Optional, AsyncGenerator
+import re
+from typing import List, Optional, AsyncGenerator
 from google import genai
 
 
+# Above ~100k tokens (~4 chars/token) a single prompt is dominated by prefill
+LONG_TRANSCRIPT_CHARS = 400_000
+
+# Target size of one map section (~8k tokens)
+SECTION_CHARS = 32_000
+
+# Bump whenever a prompt below changes (invalidates cached lecture notes)
+PROMPT_VERSION = "1"
+
+# Sentence boundary, used to cut sections without splitting sentences
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+")
+
+
 class LectureSummarizer:
     """
     Summarizes lecture transcripts into structured notes using Gemini 2.5 Flash.
@@ -34,6 +51,7 @@ class LectureSummarizer:
         # Create client with explicit API key
         self.client = genai.Client(api_key=api_key)
         self.model = "gemini-2.5-flash"
+        self.prompt_version = PROMPT_VERSION
 
     def summarize(
         self,
@@ -99,10 +117,138 @@ class LectureSummarizer:
             if chunk.text:
                 yield chunk.text
 
+    def needs_map_reduce(self, transcript: str) -> bool:
+        """Return True if the transcript is long enough to be map-reduced"""
+        return len(transcript) > LONG_TRANSCRIPT_CHARS
+
+    def split_sections(self, transcript: str) -> List[str]:
+        """
+        Map step input: Split transcript into ~SECTION_CHARS sections.
+
+        Sections end on sentence boundaries; unpunctuated text (e.g.
+        auto-generated captions) is cut on whitespace instead.
+
+        Args:
+            transcript: Full transcript text
+
+        Returns:
+            Transcript sections, in transcript order
+        """
+        sections = []
+        current: List[str] = []
+        current_len = 0
+
+        for sentence in _SENTENCE_END_RE.split(transcript):
+            for piece in self._split_long_sentence(sentence):
+                if current and current_len + len(piece) > SECTION_CHARS:
+                    sections.append(" ".join(current))
+                    current = []
+                    current_len = 0
+                current.append(piece)
+                current_len += len(piece) + 1
+
+        if current:
+            sections.append(" ".join(current))
+
+        return sections
+
+    async def asummarize_section(
+        self,
+        section: str,
+        index: int,
+        total: int,
+        video_title: Optional[str] = None
+    ) -> str:
+        """
+        Map step: Condense one transcript section into bullet notes.
+
+        Callers run the sections concurrently (one call per section).
+
+        Args:
+            section: One element of split_sections()
+            index: Position of the section (0-based)
+            total: Number of sections
+            video_title: Optional video title for context
+
+        Returns:
+            Condensed notes for the section
+
+        Raises:
+            Exception: If summarization fails
+        """
+        response = await self.client.aio.models.generate_content(
+            model=self.model,
+            contents=self._build_section_prompt(section, index, total, video_title)
+        )
+        return response.text or ""
+
+    async def reduce_stream(
+        self,
+        section_notes: List[str],
+        video_title: Optional[str] = None
+    ) -> AsyncGenerator[str, None]:
+        """
+        Reduce step (streaming): Merge section notes into final lecture notes.
+
+        Args:
+            section_notes: asummarize_section() output per section, in order
+            video_title: Optional video title for context
+
+        Yields:
+            Text chunks as they are generated by Gemini
+
+        Raises:
+            Exception: If summarization fails
+        """
+        async for chunk in self.summarize_stream(
+            self._join_sections(section_notes),
+            video_title
+        ):
+            yield chunk
+
     # =========================================================================
     # PRIVATE METHODS - Implementation details hidden from interface
     # =========================================================================
 
+    def _split_long_sentence(self, sentence: str) -> List[str]:
+        """Cut a sentence longer than SECTION_CHARS on whitespace (hard cut if none)"""
+        pieces = []
+        while len(sentence) > SECTION_CHARS:
+            cut = sentence.rfind(" ", 0, SECTION_CHARS + 1)
+            if cut <= 0:
+                cut = SECTION_CHARS
+            pieces.append(sentence[:cut])
+            sentence = sentence[cut:].lstrip()
+        pieces.append(sentence)
+        return pieces
+
+    def _join_sections(self, section_notes: List[str]) -> str:
+        """Label section notes so the reduce pass keeps lecture order"""
+        return "\n\n".join(
+            f"[Part {i + 1} of {len(section_notes)}]\n{notes}"
+            for i, notes in enumerate(section_notes)
+        )
+
+    def _build_section_prompt(
+        self,
+        section: str,
+        index: int,
+        total: int,
+        video_title: Optional[str] = None
+    ) -> str:
+        """Build the map-step prompt for one transcript section"""
+        title_context = f"Video Title: {video_title}\n" if video_title else ""
+
+        return f"""{title_context}This is part {index + 1} of {total} of a lecture transcript.
+
+Condense it into dense bullet notes (max ~300 words): key concepts, definitions,
+examples, and any tools or libraries mentioned. No intro or outro text.
+
+Transcript part:
+{section}
+
+Notes:"""
+
     def _build_prompt(
         self,
         transcript: str,
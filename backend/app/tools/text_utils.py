@@ -0,0 +1,47 @@
+"""
+Transcript text utilities
+Cheap normalization applied once before transcripts reach the LLM prompts
+
+Black box interface:
+- normalize_transcript(text) -> str
+
+Auto-generated YouTube captions carry sound-effect markers ("[Music]",
+"[Applause]"), stuttered repeats and irregular whitespace; none of it helps
+the summarizer or tool extractor, but all of it costs input tokens.
+The output is prompt input only: the raw transcript is what gets stored
+and shown to users.
+"""
+import re
+
+
+# Known caption markers only; other brackets (e.g. code like "arr[i + 1]") are kept
+_BRACKET_RE = re.compile(
+    r"\[(?:Music|Applause|Laughter|Laughs|Cheering|Cheers|Inaudible|"
+    r"Silence|Foreign|Noise|Background Noise|Sound|Sounds)\]",
+    re.IGNORECASE
+)
+
+# Immediately repeated phrases of 1-3 alphabetic words ("the the",
+# "you know you know"); numbers are never collapsed ("0 1 1 2 3")
+_REPEAT_RE = re.compile(
+    r"\b([^\W\d_]+(?:\s+[^\W\d_]+){0,2})(?:\s+\1\b)+",
+    re.IGNORECASE
+)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_transcript(text: str) -> str:
+    """
+    Strip caption markers, collapse stuttered repeats and whitespace.
+
+    Args:
+        text: Raw transcript text
+
+    Returns:
+        Normalized transcript text
+    """
+    text = _BRACKET_RE.sub(" ", text)
+    text = _WHITESPACE_RE.sub(" ", text)
+    text = _REPEAT_RE.sub(r"\1", text)
+    return text.strip()
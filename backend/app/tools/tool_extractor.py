@@ -7,13 +7,34 @@ Black box interface:
 - Output: List of AI tools (List[AITool])
 """
 import os
-from typing import List
-from openai import OpenAI
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+import httpx
+from openai import OpenAI, AsyncOpenAI
 from pydantic import BaseModel, Field
 
 from app.models import AITool
 
 
+logger = logging.getLogger("notelens.tool_extractor")
+
+# Cap on generated tokens (~100 per tool): GPT-4o-mini's output limit, so
+# tool-heavy lectures fit while a runaway response stays bounded
+MAX_OUTPUT_TOKENS = 16384
+
+# Bump whenever the prompt below changes (invalidates cached tool lists)
+PROMPT_VERSION = "1"
+
+# Keep-alive pool for the shared async client (reused across requests)
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+HTTP_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+
+
+class ToolExtractionTruncatedError(RuntimeError):
+    """Structured output was cut off at MAX_OUTPUT_TOKENS (incomplete JSON)"""
+
+
 class ToolExtractionResult(BaseModel):
     """Pydantic model for structured output from GPT-4o-mini"""
     tools: List[AITool] = Field(
@@ -22,6 +43,36 @@ class ToolExtractionResult(BaseModel):
     )
 
 
+def _to_strict_schema(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Adapt a Pydantic JSON schema for OpenAI strict structured outputs.
+
+    Objects get additionalProperties=false and every property required;
+    `default: null` (optional fields) is dropped. Applied recursively.
+    """
+    if isinstance(schema, dict):
+        schema = {key: _to_strict_schema(value) for key, value in schema.items()}
+        if schema.get("type") == "object" and "properties" in schema:
+            schema["additionalProperties"] = False
+            schema["required"] = list(schema["properties"])
+        if "default" in schema and schema["default"] is None:
+            del schema["default"]
+    elif isinstance(schema, list):
+        schema = [_to_strict_schema(item) for item in schema]
+    return schema
+
+
+# Generated once: the SDK's parse() helper rebuilds this from the model per call
+RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "ToolExtractionResult",
+        "strict": True,
+        "schema": _to_strict_schema(ToolExtractionResult.model_json_schema()),
+    },
+}
+
+
 class AIToolExtractor:
     """
     Extracts AI tools/frameworks/libraries from lecture transcripts using GPT-4o-mini.
@@ -41,9 +92,14 @@ class AIToolExtractor:
         if not api_key:
             raise ValueError("OPENAI_API_KEY must be set in environment")
 
-        # Create OpenAI client
+        # Create OpenAI clients (sync for scripts, async for the orchestrator)
         self.client = OpenAI(api_key=api_key)
+        self._api_key = api_key
+        # Async client is created lazily per event loop (see async_client)
+        self._async_client: Optional[AsyncOpenAI] = None
+        self._async_client_loop: Optional[asyncio.AbstractEventLoop] = None
         self.model = "gpt-4o-mini"
+        self.prompt_version = PROMPT_VERSION
 
     def extract(self, transcript: str, video_title: str = None) -> List[AITool]:
         """
@@ -57,39 +113,121 @@ class AIToolExtractor:
             List of AITool objects
 
         Raises:
+            ToolExtractionTruncatedError: If the response was cut off at MAX_OUTPUT_TOKENS
             Exception: If extraction fails
         """
         # Build the prompt
         prompt = self._build_prompt(transcript, video_title)
 
-        # Extract using GPT-4o-mini with structured outputs
-        # Verified October 2025: Use beta.chat.completions.parse() for Pydantic
+        # Extract using GPT-4o-mini with structured outputs (precomputed schema)
         # temperature=0 ensures deterministic results (same input = same output)
-        response = self.client.beta.chat.completions.parse(
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=self._build_messages(prompt),
+            response_format=RESPONSE_FORMAT,
+            max_completion_tokens=MAX_OUTPUT_TOKENS,
+            temperature=0  # Deterministic extraction
+        )
+
+        return self._parse_tools(response)
+
+    async def aextract(self, transcript: str, video_title: str = None) -> List[AITool]:
+        """
+        Async interface: Extract AI tools without blocking the event loop.
+
+        Args:
+            transcript: Full transcript text
+            video_title: Optional video title for context
+
+        Returns:
+            List of AITool objects
+
+        Raises:
+            ToolExtractionTruncatedError: If the response was cut off at MAX_OUTPUT_TOKENS
+            Exception: If extraction fails
+        """
+        # Build the prompt
+        prompt = self._build_prompt(transcript, video_title)
+
+        response = await self.async_client.chat.completions.create(
             model=self.model,
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are an expert at identifying AI tools, frameworks, libraries, models, and platforms mentioned in technical content."
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            response_format=ToolExtractionResult,
+            messages=self._build_messages(prompt),
+            response_format=RESPONSE_FORMAT,
+            max_completion_tokens=MAX_OUTPUT_TOKENS,
             temperature=0  # Deterministic extraction
         )
 
-        # Extract the parsed response
-        result = response.choices[0].message.parsed
+        return self._parse_tools(response)
+
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """
+        Async client bound to the running event loop.
+
+        Pooled httpx connections cannot be reused from another loop, so a
+        new client is created when the loop changes (asyncio.run, test
+        clients, reloads). Must be accessed from within a running loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            self._async_client = AsyncOpenAI(
+                api_key=self._api_key,
+                # HTTP/2 multiplexes concurrent requests over one TLS connection
+                http_client=httpx.AsyncClient(
+                    http2=True,
+                    limits=HTTP_LIMITS,
+                    timeout=HTTP_TIMEOUT
+                )
+            )
+            self._async_client_loop = loop
+        return self._async_client
 
-        return result.tools if result else []
+    async def aclose(self) -> None:
+        """Close the async HTTP connection pool (call once on app shutdown)"""
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
+            self._async_client_loop = None
 
     # =========================================================================
     # PRIVATE METHODS - Implementation details hidden from interface
     # =========================================================================
 
+    def _parse_tools(self, response) -> List[AITool]:
+        """
+        Validate the structured-output JSON (refusals yield no tools).
+
+        A response cut off at the token cap is incomplete JSON; it is raised
+        as ToolExtractionTruncatedError (a RuntimeError) instead of surfacing
+        as a ValueError (which callers treat as a client error).
+        """
+        choice = response.choices[0]
+        if choice.finish_reason == "length":
+            logger.error(
+                "Tool extraction truncated at %d output tokens", MAX_OUTPUT_TOKENS
+            )
+            raise ToolExtractionTruncatedError(
+                f"Tool extraction output exceeded {MAX_OUTPUT_TOKENS} tokens"
+            )
+
+        content = choice.message.content
+        if not content:
+            return []
+        return ToolExtractionResult.model_validate_json(content).tools
+
+    def _build_messages(self, prompt: str) -> List[dict]:
+        """Build the chat messages shared by the sync and async extraction paths"""
+        return [
+            {
+                "role": "system",
+                "content": "You are an expert at identifying AI tools, frameworks, libraries, models, and platforms mentioned in technical content."
+            },
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ]
+
     def _build_prompt(self, transcript: str, video_title: str = None) -> str:
         """
         Build optimized prompt for GPT-4o-mini entity extraction.
@@ -2,14 +2,100 @@
 YouTube Transcript Extraction Tool
 Adapted from original implementation, cleaned for FastAPI usage
 """
+import os
 import re
-from typing import Dict, List, Optional, Any
+import asyncio
+import logging
+import functools
+from bisect import bisect_left
+from urllib.parse import parse_qs, urlsplit
+from typing import Dict, List, Optional, Any, Tuple
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from diskcache import Cache
 from youtube_transcript_api import YouTubeTranscriptApi
 import yt_dlp
 
 from app.models import TranscriptChunk, VideoMetadata, TranscriptData
 
 
+logger = logging.getLogger("notelens.youtube")
+
+# Single pre-compiled pattern for watch?v=, youtu.be/, shorts/, embed/, live/ and /v/ URLs.
+# The ID must end at a delimiter or end of string; no trailing .* to scan or backtrack.
+_YT_ID_RE = re.compile(
+    r'(?:[?&]v=|youtu\.be/|/shorts/|/embed/|/live/|/v/)([0-9A-Za-z_-]{11})(?=[?&#/]|$)'
+)
+
+# A bare video ID passed instead of a URL
+_BARE_ID_RE = re.compile(r'[0-9A-Za-z_-]{11}')
+
+
+@functools.lru_cache(maxsize=1024)
+def extract_video_id(url: str) -> Optional[str]:
+    """
+    Extract the 11-character video ID from a YouTube URL (no network call).
+
+    Args:
+        url: YouTube URL in any supported format, or a bare 11-character ID
+
+    Returns:
+        Video ID, or None if the URL is not recognized
+    """
+    # Pasted URLs often carry surrounding whitespace; the ID lookahead needs a clean end
+    url = url.strip()
+
+    if len(url) == 11 and _BARE_ID_RE.fullmatch(url):
+        return url
+
+    match = _YT_ID_RE.search(url)
+    return match.group(1) if match else None
+
+
+# ============================================================================
+# Disk Cache - metadata and transcripts keyed by video_id
+# ============================================================================
+
+# Metadata (title/uploader) can be edited; transcripts rarely change
+METADATA_TTL_S = 24 * 3600
+TRANSCRIPT_TTL_S = 7 * 24 * 3600
+
+_disk_cache: Optional[Cache] = None
+
+# Caption languages in order of preference (manual subtitles before auto captions)
+CAPTION_LANGUAGES = ('en', 'en-US')
+
+# Sync client for caption track downloads (runs on worker threads, thread-safe).
+# HTTP/2 multiplexes concurrent downloads over one connection. Compression
+# needs no header: httpx already negotiates gzip/deflate (plus br/zstd when
+# those decoders are installed), and caption JSON compresses ~8x.
+_caption_http = httpx.Client(
+    http2=True,
+    timeout=10.0,
+    follow_redirects=True
+)
+
+
+def _get_disk_cache() -> Optional[Cache]:
+    """
+    Get or create the on-disk cache (None when CACHE_DISABLED=1).
+
+    Keys use the video_id only, so watch/shorts/embed URLs share entries.
+    diskcache is thread- and process-safe, so worker threads and uvicorn
+    workers can share one directory (YOUTUBE_CACHE_DIR).
+    """
+    global _disk_cache
+
+    if os.getenv("CACHE_DISABLED") == "1":
+        return None
+
+    if _disk_cache is None:
+        _disk_cache = Cache(os.getenv("YOUTUBE_CACHE_DIR", ".cache/youtube"))
+
+    return _disk_cache
+
+
 class YouTubeTranscriptExtractor:
     """
     Extracts transcripts and metadata from YouTube videos.
@@ -17,10 +103,25 @@ class YouTubeTranscriptExtractor:
     Black box interface:
     - Input: YouTube URL (string)
     - Output: TranscriptData (metadata + chunks + full text)
+      or (metadata, full text) when only the text is needed
 
     No internal implementation details exposed.
     """
 
+    def __init__(self):
+        """
+        Create one youtube-transcript-api client backed by a pooled
+        requests.Session, so keep-alive connections and TLS sessions are
+        reused across videos instead of rebuilt per fetch.
+        """
+        # requests already sends Accept-Encoding: gzip, deflate by default
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        self._transcript_api = YouTubeTranscriptApi(http_client=session)
+
     def extract(self, video_url: str) -> TranscriptData:
         """
         Main interface: Extract transcript and metadata from YouTube video.
@@ -35,23 +136,92 @@ class YouTubeTranscriptExtractor:
             ValueError: If URL is invalid or transcript unavailable
             Exception: For other extraction failures
         """
+        metadata, transcript_raw = self._fetch(video_url)
+
+        # Process into chunks (full text is derived from them)
+        chunks = self._create_chunks(transcript_raw, metadata.video_id)
+
+        return TranscriptData(
+            metadata=metadata,
+            transcript_chunks=chunks
+        )
+
+    def extract_text_only(self, video_url: str) -> Tuple[VideoMetadata, str]:
+        """
+        Lean interface: Extract metadata and full transcript text only.
+
+        Skips building TranscriptChunk models; use when timestamps are not needed.
+
+        Args:
+            video_url: Valid YouTube URL
+
+        Returns:
+            Tuple of (VideoMetadata, full transcript text)
+
+        Raises:
+            ValueError: If URL is invalid or transcript unavailable
+            Exception: For other extraction failures
+        """
+        metadata, transcript_raw = self._fetch(video_url)
+        return metadata, self._build_full_text(transcript_raw)
+
+    async def aextract(self, video_url: str) -> TranscriptData:
+        """
+        Async interface: Extract transcript and metadata without blocking the event loop.
+
+        yt-dlp and youtube-transcript-api only ship blocking clients, so the
+        sync extraction runs on a worker thread.
+
+        Args:
+            video_url: Valid YouTube URL
+
+        Returns:
+            TranscriptData with metadata, chunks, and full text
+
+        Raises:
+            ValueError: If URL is invalid or transcript unavailable
+            Exception: For other extraction failures
+        """
+        return await asyncio.to_thread(self.extract, video_url)
+
+    async def aextract_text_only(self, video_url: str) -> Tuple[VideoMetadata, str]:
+        """
+        Async interface for extract_text_only (runs on a worker thread).
+
+        Args:
+            video_url: Valid YouTube URL
+
+        Returns:
+            Tuple of (VideoMetadata, full transcript text)
+
+        Raises:
+            ValueError: If URL is invalid or transcript unavailable
+            Exception: For other extraction failures
+        """
+        return await asyncio.to_thread(self.extract_text_only, video_url)
+
+    # ============================================================================
+    # PRIVATE METHODS - Implementation details hidden from interface
+    # ============================================================================
+
+    def _fetch(self, video_url: str) -> Tuple[VideoMetadata, List[Dict]]:
+        """Resolve video ID, then fetch metadata and raw transcript segments"""
         # Extract video ID
         video_id = self._extract_video_id(video_url)
         if not video_id:
             raise ValueError("Invalid YouTube URL format")
 
-        # Get video metadata
-        metadata_dict = self._get_video_metadata(video_url, video_id)
+        # Canonical watch URL: input may be a bare ID or a shorts/embed/youtu.be link
+        video_url = f"https://www.youtube.com/watch?v={video_id}"
 
-        # Get transcript
-        transcript_raw = self._get_transcript(video_id)
+        # Get video metadata; the same yt-dlp lookup yields the caption track URL
+        metadata_dict, caption_url = self._get_video_metadata(video_url, video_id)
+
+        # Get transcript (direct caption download, youtube-transcript-api fallback)
+        transcript_raw = self._get_transcript(video_id, caption_url)
         if not transcript_raw:
             raise ValueError("No transcript available for this video")
 
-        # Process into chunks and full text
-        full_text = self._build_full_text(transcript_raw)
-        chunks = self._create_chunks(transcript_raw, video_id)
-
         # Build metadata object
         metadata = VideoMetadata(
             video_id=video_id,
@@ -61,63 +231,135 @@ class YouTubeTranscriptExtractor:
             duration=metadata_dict.get('duration')
         )
 
-        return TranscriptData(
-            metadata=metadata,
-            transcript_chunks=chunks,
-            full_text=full_text
-        )
-
-    # ============================================================================
-    # PRIVATE METHODS - Implementation details hidden from interface
-    # ============================================================================
+        return metadata, transcript_raw
 
     def _extract_video_id(self, url: str) -> Optional[str]:
         """Extract video ID from various YouTube URL formats"""
-        patterns = [
-            r'(?:v=|\/)([0-9A-Za-z_-]{11}).*',
-            r'(?:embed\/)([0-9A-Za-z_-]{11})',
-            r'(?:v\/)([0-9A-Za-z_-]{11})'
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-        return None
+        return extract_video_id(url)
+
+    def _get_video_metadata(
+        self,
+        video_url: str,
+        video_id: str
+    ) -> Tuple[Dict[str, Any], Optional[str]]:
+        """
+        Get video metadata using yt-dlp (disk-cached).
+
+        Returns (metadata, caption_url). caption_url comes from the same
+        extract_info call (json3 caption track) and is None on a cache hit
+        or when the video has no English captions; signed caption URLs
+        expire, so they are never cached.
+        """
+        disk_cache = _get_disk_cache()
+        cache_key = f"metadata:{video_id}"
+        if disk_cache is not None:
+            cached = disk_cache.get(cache_key)
+            if cached is not None:
+                return cached, None
 
-    def _get_video_metadata(self, video_url: str, video_id: str) -> Dict[str, Any]:
-        """Get video metadata using yt-dlp (minimal extraction)"""
         try:
             ydl_opts = {
                 'quiet': True,
                 'no_warnings': True,
                 'skip_download': True,
-                'extract_flat': True,
             }
 
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
                 info = ydl.extract_info(video_url, download=False)
                 if info is None:
-                    return {'title': f'Video {video_id}', 'uploader': 'Unknown'}
+                    return {'title': f'Video {video_id}', 'uploader': 'Unknown'}, None
 
-                return {
+                metadata = {
                     'title': info.get('title', 'Unknown Title'),
                     'uploader': info.get('uploader', 'Unknown Channel'),
                     'duration': info.get('duration')
                 }
+
+            # Only successful lookups are cached (fallbacks are retried next time)
+            if disk_cache is not None:
+                disk_cache.set(cache_key, metadata, expire=METADATA_TTL_S)
+            return metadata, self._find_caption_url(info)
         except Exception as e:
-            print(f"Warning: Could not fetch metadata: {e}")
-            return {'title': f'Video {video_id}', 'uploader': 'Unknown'}
+            logger.warning("Could not fetch metadata: %s", e)
+            return {'title': f'Video {video_id}', 'uploader': 'Unknown'}, None
+
+    def _find_caption_url(self, info: Dict[str, Any]) -> Optional[str]:
+        """
+        Pick the json3 URL of the preferred English caption track from yt-dlp info.
+
+        yt-dlp lists YouTube's machine translations of the original-language
+        ASR track under automatic_captions too (their URLs carry a tlang
+        parameter). Those are skipped, so a non-English video falls back to
+        youtube-transcript-api, which only returns original-language tracks.
+        """
+        for tracks_key in ('subtitles', 'automatic_captions'):
+            tracks = info.get(tracks_key) or {}
+            for language in CAPTION_LANGUAGES:
+                for track in tracks.get(language) or []:
+                    url = track.get('url')
+                    if track.get('ext') != 'json3' or not url:
+                        continue
+                    if 'tlang' in parse_qs(urlsplit(url).query):
+                        continue  # Machine translation, not the spoken language
+                    return url
+        return None
 
-    def _get_transcript(self, video_id: str) -> Optional[List[Dict]]:
+    def _get_transcript(
+        self,
+        video_id: str,
+        caption_url: Optional[str] = None
+    ) -> Optional[List[Dict]]:
+        """
+        Get transcript segments (disk-cached).
+
+        Downloads the caption track directly when yt-dlp already resolved its
+        URL, saving youtube-transcript-api's own page lookup; otherwise (or if
+        the download fails) falls back to youtube-transcript-api.
+        """
+        disk_cache = _get_disk_cache()
+        cache_key = f"transcript:{video_id}"
+        if disk_cache is not None:
+            cached = disk_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        transcript = None
+        if caption_url:
+            transcript = self._download_caption_track(caption_url)
+        if not transcript:
+            transcript = self._fetch_transcript_api(video_id)
+
+        if disk_cache is not None and transcript:
+            disk_cache.set(cache_key, transcript, expire=TRANSCRIPT_TTL_S)
+        return transcript
+
+    def _download_caption_track(self, caption_url: str) -> Optional[List[Dict]]:
+        """Download and parse a json3 caption track into text + start segments"""
+        try:
+            response = _caption_http.get(caption_url)
+            response.raise_for_status()
+
+            transcript = []
+            for event in response.json().get('events', []):
+                segs = event.get('segs')
+                if not segs:
+                    continue
+                text = "".join(seg.get('utf8', '') for seg in segs).strip()
+                if text:
+                    transcript.append({"text": text, "start": event.get('tStartMs', 0) / 1000})
+            return transcript
+        except Exception as e:
+            logger.warning("Caption track download failed, falling back: %s", e)
+            return None
+
+    def _fetch_transcript_api(self, video_id: str) -> Optional[List[Dict]]:
         """Get transcript using youtube-transcript-api v1.2.3"""
         try:
             # Updated API for version 1.2.3
-            # Create instance and fetch transcript
-            api = YouTubeTranscriptApi()
-            transcript_data = api.fetch(
+            # Shared instance (pooled session) created in __init__
+            transcript_data = self._transcript_api.fetch(
                 video_id,
-                languages=['en', 'en-US']  # Try English, fallback to US English
+                languages=list(CAPTION_LANGUAGES)  # Try English, fallback to US English
             )
 
             # Return minimal structure: text + start time
@@ -127,7 +369,7 @@ class YouTubeTranscriptExtractor:
                 for item in transcript_data
             ]
         except Exception as e:
-            print(f"Transcript extraction failed: {e}")
+            logger.warning("Transcript extraction failed: %s", e)
             return None
 
     def _build_full_text(self, transcript_data: List[Dict]) -> str:
@@ -142,36 +384,28 @@ class YouTubeTranscriptExtractor:
         """
         Create transcript chunks with timestamps.
         For Phase 0, we'll keep it simple - just group by time intervals.
+
+        Segment start times are sorted, so each chunk boundary is found with
+        one binary search (C-level) instead of a per-segment Python comparison,
+        and each chunk's text is a single join over a list slice.
         """
         chunks = []
         chunk_duration = 60  # 60 seconds per chunk
-        current_chunk_text = []
-        current_chunk_start = 0
+        starts = [item['start'] for item in transcript_data]
+        texts = [item['text'] for item in transcript_data]
+
+        chunk_start = 0
         chunk_index = 0
+        while chunk_start < len(starts):
+            # First later segment at or past this chunk's time limit
+            chunk_end = bisect_left(starts, (chunk_index + 1) * chunk_duration, chunk_start + 1)
 
-        for item in transcript_data:
-            start_time = item['start']
-
-            # Start new chunk if we've exceeded duration
-            if start_time >= (chunk_index + 1) * chunk_duration:
-                if current_chunk_text:
-                    chunks.append(TranscriptChunk(
-                        chunk_id=f"{video_id}_chunk_{chunk_index + 1}",
-                        text=" ".join(current_chunk_text),
-                        start_time=current_chunk_start
-                    ))
-                    chunk_index += 1
-                    current_chunk_text = []
-                    current_chunk_start = start_time
-
-            current_chunk_text.append(item['text'])
-
-        # Add final chunk
-        if current_chunk_text:
             chunks.append(TranscriptChunk(
                 chunk_id=f"{video_id}_chunk_{chunk_index + 1}",
-                text=" ".join(current_chunk_text),
-                start_time=current_chunk_start
+                text=" ".join(texts[chunk_start:chunk_end]),
+                start_time=starts[chunk_start] if chunk_index else 0
             ))
+            chunk_index += 1
+            chunk_start = chunk_end
 
         return chunks